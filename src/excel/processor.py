@@ -2,17 +2,34 @@
 Excel file processing module for TNS Booking Uploader Bot.
 """
 
+import hashlib
+import logging
+import numpy as np
+import openpyxl
+import operator
 import pandas as pd
+import os
+import pickle
+import re
+import threading
+from collections import OrderedDict
+from copy import copy, deepcopy
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Iterator, Optional, Tuple
 import traceback
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 from ..utils.logger import get_logger
 from ..utils.validators import Validator
 
 logger = get_logger()
 
+# Strings int() accepts as a whole number, used to check Shift column-wise
+_SHIFT_NUMBER_RE = re.compile(r'[+-]?\d+(?:_\d+)*')
+
+# pandas' ISO date parser accepts signed years ("-2025-04-09") that strptime rejects
+_LEADING_DIGIT_RE = re.compile(r'\d')
+
 
 @dataclass
 class ProcessingResult:
@@ -32,25 +49,110 @@ class ProcessingResult:
 
 class ExcelProcessor:
     """Handles Excel file processing and data validation."""
+
+    # Booking fields extracted from each row (Mobile and Status are optional)
+    BOOKING_COLUMNS = ('Date', 'Time', 'Driver', 'From', 'To', 'Reason', 'Shift', 'Mobile', 'Status')
+
+    # Header row of the exported validation report
+    REPORT_COLUMNS = ('Row Number', 'Date', 'Time', 'Driver', 'From', 'To',
+                      'Reason', 'Shift', 'Valid', 'Errors')
+
+    # Number of status updates held in memory before they are written to disk.
+    # This batching is for bulk updates; callers recording the result of a
+    # booking should flush() straight away so a crash can't lose it
+    STATUS_FLUSH_INTERVAL = 10
+
+    # Number of processing results kept for files that haven't changed since
+    # (in memory, and in cache_dir when one is given)
+    RESULT_CACHE_SIZE = 8
+
+    # Suggested cache_dir for keeping processing results between runs
+    DISK_CACHE_DIR = Path.home() / ".tns_uploader" / "cache"
+
+    # Version of the results saved in cache_dir; bump it whenever validation
+    # rules, BOOKING_COLUMNS or ProcessingResult change so that results saved
+    # by an older release are discarded instead of reused
+    CACHE_VERSION = 1
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize the Excel processor.
+
+        Args:
+            cache_dir: Folder for keeping processing results between runs
+                (e.g. DISK_CACHE_DIR); None keeps them in memory only
+        """
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+
+        # Status updates waiting to be written by flush(), keyed by Excel row number
+        self._file_path = None
+        self._row_count = None
+        self._pending_status = {}
+
+        # Workbook kept open between flushes, so each flush only has to save;
+        # reloaded if the file changes on disk after our last save
+        self._workbook = None
+        self._sheet = None
+        self._status_col = None
+        self._saved_mtime = None
+
+        # Status updates arrive from background threads
+        self._lock = threading.RLock()
+
+        # ProcessingResults keyed by (abspath, st_mtime_ns, st_size)
+        self._result_cache = OrderedDict()
+
+        # Counts from the most recent iter_process() run
+        self.last_stats = {}
     
-    def __init__(self):
-        """Initialize the Excel processor."""
-        pass
-    
-    def process_file(self, file_path: str) -> ProcessingResult:
-        """Process an Excel file and validate its contents."""
+    def process_file(self, file_path: str,
+                     progress_callback: Optional[Callable[[float], None]] = None) -> ProcessingResult:
+        """Process an Excel file and validate its contents.
+
+        Args:
+            file_path: Path to the Excel file
+            progress_callback: Called with 0.0 when the workbook read starts (its
+                length isn't known in advance), then with the fraction done
+                (up to 1.0) as each later stage finishes
+        """
+        def report(fraction: float):
+            if progress_callback is not None:
+                progress_callback(fraction)
+
         try:
+            # Write any pending status updates before re-reading the file
+            self.flush()
+
             # Validate file
             if not Validator.is_valid_excel_file(file_path):
                 return ProcessingResult(success=False, error_message="Invalid Excel file")
 
+            # Reuse the result of an earlier run if the file hasn't changed since
+            cache_key = self._result_cache_key(file_path)
+            cached = self._result_cache.get(cache_key)
+            if cached is None:
+                cached = self._load_cached_result(cache_key)
+                if cached is not None:
+                    self._remember_result(cache_key, cached)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                logger.info(f"Using cached processing result for: {file_path}")
+                self._track_status_file(file_path, cached.row_count)
+                report(1.0)
+                return deepcopy(cached)
+
             # Read Excel file
+            report(0.0)
             df = self._read_excel_file(file_path)
             if df is None:
                 return ProcessingResult(success=False, error_message="Failed to read Excel file")
+            report(0.4)
 
             # Add Status column if it doesn't exist
             df = self._ensure_status_column(df, file_path)
+            report(0.7)
+
+            # Track this file for subsequent status updates
+            self._track_status_file(file_path, len(df))
 
             # Validate column structure
             if not Validator.validate_column_structure(df.columns.tolist()):
@@ -61,8 +163,9 @@ class ExcelProcessor:
 
             # Process and validate data
             processed_data, validation_results = self._process_data(df)
+            report(0.9)
 
-            return ProcessingResult(
+            result = ProcessingResult(
                 success=True,
                 data=processed_data,
                 row_count=len(df),
@@ -71,38 +174,141 @@ class ExcelProcessor:
                 errors=validation_results['errors']
             )
 
+            # Keyed on the file as it is now, since adding the Status column may have saved it
+            cache_key = self._result_cache_key(file_path)
+            self._remember_result(cache_key, deepcopy(result))
+            self._store_cached_result(cache_key, result)
+            report(1.0)
+
+            return result
+
         except Exception as e:
-            error_msg = f"Error processing Excel file: {str(e)}"
-            logger.error(error_msg)
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            return ProcessingResult(success=False, error_message=error_msg)
+            logger.error("Error processing Excel file: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Traceback: %s", traceback.format_exc())
+            return ProcessingResult(success=False, error_message=f"Error processing Excel file: {e}")
     
+    @staticmethod
+    def _result_cache_key(file_path: str) -> Tuple[str, int, int]:
+        """Identify a file's current contents by path, modification time and size."""
+        stat = os.stat(file_path)
+        return os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+
+    def _remember_result(self, cache_key: Tuple[str, int, int], result: ProcessingResult):
+        """Add a result to the in-memory cache, dropping the least recently used."""
+        self._result_cache[cache_key] = result
+        while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+
+    def _disk_cache_path(self, cache_key: Tuple[str, int, int]) -> Optional[Path]:
+        """Return the cache_dir file for a cache key, or None if disk caching is off."""
+        if self._cache_dir is None:
+            return None
+        digest = hashlib.sha1("|".join(map(str, (self.CACHE_VERSION,) + cache_key)).encode("utf-8")).hexdigest()
+        return self._cache_dir / f"v{self.CACHE_VERSION}-{digest}.pkl"
+
+    @classmethod
+    def _cache_schema(cls) -> Dict[str, Any]:
+        """Describe the shape of a cached result, saved alongside it and checked on load."""
+        return {
+            'version': cls.CACHE_VERSION,
+            'booking_columns': cls.BOOKING_COLUMNS,
+            'result_fields': tuple(field.name for field in fields(ProcessingResult)),
+        }
+
+    def _load_cached_result(self, cache_key: Tuple[str, int, int]) -> Optional[ProcessingResult]:
+        """Load a result saved by an earlier run, if there is one."""
+        cache_path = self._disk_cache_path(cache_key)
+        if cache_path is None or not cache_path.exists():
+            return None
+
+        try:
+            with open(cache_path, 'rb') as f:
+                entry = pickle.load(f)
+        except Exception as e:
+            logger.warning("Ignoring unreadable cached result %s: %s", cache_path, e)
+            return None
+
+        # Only trust results saved with the current cache version and schema
+        if not isinstance(entry, dict):
+            entry = {}
+        result = entry.get('result')
+        if (entry.get('schema') != self._cache_schema()
+                or not isinstance(result, ProcessingResult)
+                or not isinstance(result.data, list)):
+            logger.warning("Discarding outdated cached result: %s", cache_path)
+            try:
+                cache_path.unlink()
+            except OSError:
+                pass
+            return None
+
+        return result
+
+    def _store_cached_result(self, cache_key: Tuple[str, int, int], result: ProcessingResult):
+        """Save a result for later runs, keeping the RESULT_CACHE_SIZE newest files."""
+        cache_path = self._disk_cache_path(cache_key)
+        if cache_path is None:
+            return
+
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temporary file first so a crash never leaves a partial pickle
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'schema': self._cache_schema(), 'result': result}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+
+            # Results saved under another cache version will never be read again
+            current_prefix = f"v{self.CACHE_VERSION}-"
+            for stale_file in self._cache_dir.glob('*.pkl'):
+                if not stale_file.name.startswith(current_prefix):
+                    stale_file.unlink()
+
+            cached_files = sorted(self._cache_dir.glob(f'{current_prefix}*.pkl'),
+                                  key=lambda p: p.stat().st_mtime, reverse=True)
+            for old_file in cached_files[self.RESULT_CACHE_SIZE:]:
+                old_file.unlink()
+        except Exception as e:
+            logger.warning("Could not save processing result to cache: %s", e)
+
     def _read_excel_file(self, file_path: str) -> Optional[pd.DataFrame]:
         """Read Excel file using pandas."""
         try:
             logger.info(f"Reading Excel file: {file_path}")
-            df = pd.read_excel(file_path)
+            try:
+                # The Rust-based calamine reader is much faster than openpyxl
+                df = pd.read_excel(file_path, engine='calamine')
+            except Exception as e:
+                # Not installed (pandas < 2.2 or no python-calamine) or unreadable
+                logger.debug(f"Calamine engine unavailable, using default engine: {e}")
+                df = pd.read_excel(file_path)
             logger.info(f"Successfully read Excel file with {len(df)} rows")
+
+            # Column names are stripped here once; later steps rely on it
+            df.columns = df.columns.str.strip()
             return df
         except Exception as e:
-            logger.error(f"Error reading Excel file '{file_path}': {str(e)}")
+            logger.error("Error reading Excel file '%s': %s", file_path, e)
             return None
 
     def _ensure_status_column(self, df: pd.DataFrame, file_path: str) -> pd.DataFrame:
         """Ensure the Excel file has a Status column. If not, add it and save."""
         try:
-            # Normalize column names
-            df.columns = df.columns.str.strip()
-
             # Check if Status column exists
             if 'Status' not in df.columns:
                 logger.info("Status column not found. Adding Status column to Excel file...")
 
+                # Add the header cell in place; the rest of the sheet is untouched
+                workbook, sheet = self._load_first_sheet(file_path)
+                status_cell = sheet.cell(row=1, column=sheet.max_column + 1, value='Status')
+                self._copy_header_style(sheet, status_cell)
+                workbook.save(file_path)
+
                 # Add Status column with empty values
                 df['Status'] = ''
-
-                # Save the updated DataFrame back to Excel
-                df.to_excel(file_path, index=False)
                 logger.info(f"✅ Status column added and saved to: {file_path}")
             else:
                 logger.info("✅ Status column found in Excel file")
@@ -118,7 +324,7 @@ class ExcelProcessor:
             return df
 
         except Exception as e:
-            logger.error(f"Error ensuring Status column: {str(e)}")
+            logger.error("Error ensuring Status column: %s", e)
             # Return original DataFrame if there's an error
             return df
 
@@ -132,51 +338,44 @@ class ExcelProcessor:
         }
         
         try:
-            # Normalize column names (strip whitespace, handle case)
-            df.columns = df.columns.str.strip()
-            
-            # Process each row
-            for index, row in df.iterrows():
-                try:
-                    # Convert row to dictionary
-                    row_data = {
-                        'Date': row.get('Date', ''),
-                        'Time': row.get('Time', ''),
-                        'Driver': row.get('Driver', ''),
-                        'From': row.get('From', ''),
-                        'To': row.get('To', ''),
-                        'Reason': row.get('Reason', ''),
-                        'Shift': row.get('Shift', ''),
-                        'Mobile': row.get('Mobile', ''),  # Optional mobile column
-                        'Status': row.get('Status', '')  # Status column
-                    }
-
-                    # Validate row data
-                    is_valid, row_errors = Validator.validate_row_data(row_data)
-
-                    # Add row metadata
-                    row_data['row_number'] = index + 2  # +2 because Excel is 1-indexed and has header
-                    row_data['is_valid'] = is_valid
-                    row_data['errors'] = row_errors
-
-                    processed_data.append(row_data)
-                    
-                    # Update validation counts
-                    if is_valid:
-                        validation_results['valid_count'] += 1
-                    else:
-                        validation_results['invalid_count'] += 1
-                        # Log detailed error for this invalid row
-                        logger.warning(f"❌ Invalid row {row_data['row_number']}:")
-                        for error in row_errors:
-                            logger.warning(f"   - {error}")
-                            validation_results['errors'].append(f"Row {row_data['row_number']}: {error}")
-                    
-                except Exception as e:
-                    logger.error(f"Error processing row {index + 2}: {str(e)}")
-                    validation_results['invalid_count'] += 1
-                    validation_results['errors'].append(f"Row {index + 2}: Processing error - {str(e)}")
-            
+            # Validate all rows column-wise; only invalid rows need error strings
+            valid_mask, error_matrix = self._vectorized_validate(df)
+            error_flags = error_matrix.to_numpy()
+            error_messages = error_matrix.columns.tolist()
+
+            # +2 because Excel is 1-indexed and has header
+            row_numbers = (df.index + 2).tolist()
+            invalid_positions = np.flatnonzero(~valid_mask.to_numpy()).tolist()
+            row_errors_by_position = {
+                position: [message for message, failed in zip(error_messages, error_flags[position]) if failed]
+                for position in invalid_positions
+            }
+
+            validation_results['valid_count'] = len(row_numbers) - len(invalid_positions)
+            validation_results['invalid_count'] = len(invalid_positions)
+            validation_results['errors'] = [
+                f"Row {row_numbers[position]}: {error}"
+                for position in invalid_positions
+                for error in row_errors_by_position[position]
+            ]
+
+            # Keep only the booking columns (missing optional ones become '')
+            # and build each row dict from a plain tuple in column order
+            booking_frame = df.reindex(columns=list(self.BOOKING_COLUMNS), fill_value='')
+            columns = self.BOOKING_COLUMNS
+            records = (dict(zip(columns, values))
+                       for values in booking_frame.itertuples(index=False, name=None))
+
+            for position, (row_number, row_data) in enumerate(zip(row_numbers, records)):
+                row_errors = row_errors_by_position.get(position)
+
+                # Add row metadata
+                row_data['row_number'] = row_number
+                row_data['is_valid'] = row_errors is None
+                row_data['errors'] = row_errors if row_errors is not None else []
+
+                processed_data.append(row_data)
+
             # Log summary
             logger.info("="*70)
             logger.info("DATA PROCESSING SUMMARY")
@@ -184,23 +383,180 @@ class ExcelProcessor:
             logger.info(f"✅ Valid rows: {validation_results['valid_count']}")
             logger.info(f"❌ Invalid rows: {validation_results['invalid_count']}")
 
-            if validation_results['invalid_count'] > 0:
-                logger.warning("")
-                logger.warning("INVALID ROWS DETAILS:")
-                logger.warning("-"*70)
-                for error in validation_results['errors']:
-                    logger.warning(f"  {error}")
-                logger.warning("-"*70)
+            # One warning for all invalid rows instead of one per error line;
+            # skip building it entirely when warnings are filtered out
+            if invalid_positions and logger.isEnabledFor(logging.WARNING):
+                invalid_msgs = [
+                    f"❌ Row {row_numbers[position]}: {'; '.join(row_errors_by_position[position])}"
+                    for position in invalid_positions
+                ]
+                logger.warning("\n".join(["INVALID ROWS DETAILS:", "-"*70, *invalid_msgs, "-"*70]))
 
             logger.info("="*70)
 
             return processed_data, validation_results
             
         except Exception as e:
-            logger.error(f"Error in data processing: {str(e)}")
+            logger.error("Error in data processing: %s", e)
             validation_results['errors'].append(f"Data processing error: {str(e)}")
             return processed_data, validation_results
     
+    def _vectorized_validate(self, df: pd.DataFrame) -> Tuple[pd.Series, pd.DataFrame]:
+        """Validate every row at once using column-wise masks.
+
+        Mirrors Validator.validate_row_data: returns a boolean Series that is
+        True for valid rows, and a boolean DataFrame with one column per error
+        message (in the same order) flagging which rule each row failed.
+        """
+        columns = frozenset(df.columns)
+
+        def column(name: str) -> pd.Series:
+            if name in columns:
+                return df[name]
+            return pd.Series('', index=df.index, dtype=object)
+
+        def text(name: str) -> pd.Series:
+            values = column(name).astype(object)
+            return values.where(values.notna(), '').astype(str).str.strip()
+
+        def blank(values: pd.Series) -> pd.Series:
+            return values.eq('') | values.str.lower().eq('nan')
+
+        def per_distinct_value(name: str, check) -> pd.Series:
+            # Dates/times repeat heavily in booking sheets, so run the scalar
+            # check once per distinct value and broadcast the result
+            codes, uniques = pd.factorize(column(name), use_na_sentinel=False)
+            results = np.array([bool(check(value)) for value in uniques], dtype=bool)
+            return pd.Series(results[codes], index=df.index)
+
+        def valid_dates(name: str) -> pd.Series:
+            # Parse each distinct text value with every accepted format in one
+            # vectorized to_datetime call per format; cells Excel already
+            # stored as dates are valid as-is, like validate_date_format
+            codes, uniques = pd.factorize(column(name), use_na_sentinel=False)
+            uniques = pd.Series(uniques, dtype=object)
+            is_date_object = uniques.notna() & uniques.map(lambda value: hasattr(value, 'strftime')).astype(bool)
+            date_text = uniques.where(uniques.notna(), '').astype(str).str.strip()
+            parsed = pd.Series(False, index=uniques.index)
+            for date_format in Validator.DATE_FORMATS:
+                parsed |= pd.to_datetime(date_text, format=date_format, errors='coerce').notna()
+            results = (is_date_object | (parsed & date_text.str.match(_LEADING_DIGIT_RE))).to_numpy(dtype=bool)
+            return pd.Series(results[codes], index=df.index)
+
+        shift = text('Shift')
+        shift_present = ~blank(shift)
+        shift_numeric = shift.str.fullmatch(_SHIFT_NUMBER_RE)
+
+        error_matrix = pd.DataFrame({
+            "Invalid or missing date": ~valid_dates('Date'),
+            "Invalid or missing time": ~per_distinct_value('Time', Validator.validate_time_format),
+            "Driver name is required": blank(text('Driver')),
+            "From location is required": blank(text('From')),
+            "To location is required": blank(text('To')),
+            "Shift must be a number": shift_present & ~shift_numeric,
+        }, index=df.index)
+
+        valid_mask = ~error_matrix.any(axis=1)
+        return valid_mask, error_matrix
+
+    def iter_process(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """Stream validated booking rows without loading the sheet into a DataFrame.
+
+        Yields row dicts with the same keys and validation as
+        process_file().data, one at a time, so memory stays constant
+        regardless of sheet size. Cell values are passed through as stored
+        in the sheet rather than dtype-coerced by pandas. Counts are available
+        in self.last_stats once the iterator is exhausted.
+
+        Raises:
+            ValueError: If the file is not a valid Excel file or its columns don't match
+        """
+        if not Validator.is_valid_excel_file(file_path):
+            raise ValueError("Invalid Excel file")
+
+        self.last_stats = {'row_count': 0, 'valid_count': 0, 'invalid_count': 0, 'errors': []}
+        stats = self.last_stats
+
+        rows = self._iter_sheet_rows(file_path)
+        header = [str(col).strip() if col is not None else '' for col in next(rows, ())]
+        if not Validator.validate_column_structure(header):
+            raise ValueError("Invalid column structure. Expected: Date, Time, Driver, From, To, Reason, Shift")
+
+        # Resolve each booking column to a cell position once; columns the
+        # sheet lacks point one past the header, which is always ''
+        positions = {name: pos for pos, name in reversed(list(enumerate(header)))}
+        width = len(header)
+        pick = operator.itemgetter(*(positions.get(key, width) for key in self.BOOKING_COLUMNS))
+        padding = [''] * (width + 1)
+
+        # Blank rows are only emitted once a later row has data, so trailing
+        # blank rows are dropped the same way pandas drops them
+        blank_rows = []
+
+        for row_number, values in enumerate(rows, start=2):
+            values = [self._normalize_cell(value) for value in values]
+            if all(value == '' for value in values):
+                blank_rows.append(row_number)
+                continue
+
+            for blank_row_number in blank_rows:
+                yield self._build_streamed_row(blank_row_number, pick(padding), stats)
+            blank_rows.clear()
+
+            values = values[:width]
+            values += padding[len(values):]
+            yield self._build_streamed_row(row_number, pick(values), stats)
+
+        logger.info(f"Streamed {stats['row_count']} rows: {stats['valid_count']} valid, "
+                    f"{stats['invalid_count']} invalid")
+
+    def _build_streamed_row(self, row_number: int, values: Tuple[Any, ...],
+                            stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Build and validate one booking row for iter_process() from BOOKING_COLUMNS values."""
+        row_data = dict(zip(self.BOOKING_COLUMNS, values))
+
+        is_valid, row_errors = Validator.validate_row_data(row_data)
+        row_data['row_number'] = row_number
+        row_data['is_valid'] = is_valid
+        row_data['errors'] = row_errors
+
+        stats['row_count'] += 1
+        if is_valid:
+            stats['valid_count'] += 1
+        else:
+            stats['invalid_count'] += 1
+            stats['errors'].extend(f"Row {row_number}: {error}" for error in row_errors)
+
+        return row_data
+
+    @staticmethod
+    def _normalize_cell(value: Any) -> Any:
+        """Match pandas' cell values: empty cells become '' and whole floats become ints."""
+        if value is None:
+            return ''
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+
+    @staticmethod
+    def _iter_sheet_rows(file_path: str) -> Iterator[tuple]:
+        """Yield raw row values from the first sheet, one row at a time."""
+        try:
+            from python_calamine import CalamineWorkbook
+        except ImportError:
+            CalamineWorkbook = None
+
+        if CalamineWorkbook is not None:
+            sheet = CalamineWorkbook.from_path(file_path).get_sheet_by_index(0)
+            yield from sheet.iter_rows()
+            return
+
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            yield from workbook.worksheets[0].iter_rows(values_only=True)
+        finally:
+            workbook.close()
+
     def get_sample_data_format(self) -> Dict[str, str]:
         """Get sample data format for user reference."""
         return {
@@ -215,39 +571,139 @@ class ExcelProcessor:
     
     def export_validation_report(self, processed_data: List[Dict[str, Any]],
                                output_path: str) -> bool:
-        """Export validation report to Excel file."""
+        """Export validation report to Excel file.
+
+        Rows are streamed straight to the file, so only one report row is
+        held in memory at a time.
+        """
         try:
-            # Create DataFrame from processed data
-            report_data = []
-            for row in processed_data:
-                report_row = {
-                    'Row Number': row['row_number'],
-                    'Date': row['Date'],
-                    'Time': row['Time'],
-                    'Driver': row['Driver'],
-                    'From': row['From'],
-                    'To': row['To'],
-                    'Reason': row['Reason'],
-                    'Shift': row['Shift'],
-                    'Valid': 'Yes' if row['is_valid'] else 'No',
-                    'Errors': '; '.join(row['errors']) if row['errors'] else ''
-                }
-                report_data.append(report_row)
-            
-            # Create DataFrame and save to Excel
-            report_df = pd.DataFrame(report_data)
-            report_df.to_excel(output_path, index=False, engine='openpyxl')
-            
+            try:
+                import xlsxwriter
+            except ImportError:
+                xlsxwriter = None
+
+            rows = (self._report_row(row) for row in processed_data)
+
+            if xlsxwriter is not None:
+                # constant_memory flushes each row to disk once the next one starts
+                workbook = xlsxwriter.Workbook(output_path, {
+                    'constant_memory': True,
+                    'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+                })
+                try:
+                    worksheet = workbook.add_worksheet()
+                    worksheet.write_row(0, 0, self.REPORT_COLUMNS)
+                    for row_index, values in enumerate(rows, start=1):
+                        worksheet.write_row(row_index, 0, values)
+                finally:
+                    workbook.close()
+            else:
+                workbook = openpyxl.Workbook(write_only=True)
+                worksheet = workbook.create_sheet()
+                worksheet.append(self.REPORT_COLUMNS)
+                for values in rows:
+                    worksheet.append(values)
+                workbook.save(output_path)
+
             logger.info(f"Validation report exported to: {output_path}")
             return True
             
         except Exception as e:
-            logger.error(f"Error exporting validation report: {str(e)}")
+            logger.error("Error exporting validation report: %s", e)
             return False
 
+    @staticmethod
+    def _report_row(row: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Build one validation report row; missing values are written as blank cells."""
+        values = [row['row_number']]
+        for key in ('Date', 'Time', 'Driver', 'From', 'To', 'Reason', 'Shift'):
+            value = row[key]
+            values.append('' if value is None or (not isinstance(value, str) and pd.isna(value)) else value)
+        values.append('Yes' if row['is_valid'] else 'No')
+        values.append('; '.join(row['errors']) if row['errors'] else '')
+        return tuple(values)
+
+    @staticmethod
+    def _load_first_sheet(file_path: str):
+        """Open a workbook with openpyxl and return it with the sheet pandas reads."""
+        workbook = openpyxl.load_workbook(file_path)
+        return workbook, workbook.worksheets[0]
+
+    @staticmethod
+    def _copy_header_style(sheet, cell) -> None:
+        """Give a newly added header cell the same style as the header to its left."""
+        if cell.column > 1:
+            neighbour = sheet.cell(row=1, column=cell.column - 1)
+            if neighbour.has_style:
+                cell._style = copy(neighbour._style)
+
+    @staticmethod
+    def _find_status_column(sheet) -> Optional[int]:
+        """Return the 1-based index of the Status header cell, or None."""
+        for cell in sheet[1]:
+            if isinstance(cell.value, str) and cell.value.strip() == 'Status':
+                return cell.column
+        return None
+
+    def _track_status_file(self, file_path: str, row_count: int):
+        """Remember the file (and its data row count) that status updates target."""
+        with self._lock:
+            if file_path != self._file_path:
+                # Don't drop updates still pending for the previous file
+                if not self.close():
+                    logger.error("Discarding %s unsaved status update(s) for: %s",
+                                 len(self._pending_status), self._file_path)
+                    self._pending_status.clear()
+                    self._workbook = None
+
+            self._file_path = file_path
+            self._row_count = row_count
+
+    def open_for_updates(self, file_path: str) -> bool:
+        """Load the workbook that status updates will be written to and keep it open.
+
+        update_booking_status() calls this itself for a file it isn't
+        tracking yet; call close() when done to write pending updates and
+        release the workbook.
+
+        Returns:
+            True if the workbook was loaded, False otherwise
+        """
+        try:
+            with self._lock:
+                self._track_status_file(file_path, None)
+                sheet, _ = self._status_sheet()
+                self._row_count = sheet.max_row - 1
+                return True
+
+        except Exception as e:
+            logger.error("Error opening workbook for status updates: %s", e)
+            self._file_path = None
+            self._workbook = None
+            return False
+
+    def _status_sheet(self):
+        """Return the open sheet and Status column index, loading the workbook if needed."""
+        mtime = os.stat(self._file_path).st_mtime_ns
+        if self._workbook is None or mtime != self._saved_mtime:
+            self._workbook, self._sheet = self._load_first_sheet(self._file_path)
+            self._saved_mtime = mtime
+
+            self._status_col = self._find_status_column(self._sheet)
+            if self._status_col is None:
+                self._status_col = self._sheet.max_column + 1
+                self._copy_header_style(
+                    self._sheet, self._sheet.cell(row=1, column=self._status_col, value='Status')
+                )
+
+        return self._sheet, self._status_col
+
     def update_booking_status(self, file_path: str, row_number: int, status: str) -> bool:
         """Update the status of a specific booking in the Excel file.
 
+        The change is held in memory and written to disk every
+        STATUS_FLUSH_INTERVAL updates; call flush() to write it immediately.
+
         Args:
             file_path: Path to the Excel file
             row_number: Row number in Excel (1-indexed, including header)
@@ -257,34 +713,80 @@ class ExcelProcessor:
             True if successful, False otherwise
         """
         try:
-            # Read the Excel file
-            df = pd.read_excel(file_path)
+            with self._lock:
+                if self._file_path != file_path and not self.open_for_updates(file_path):
+                    return False
 
-            # Normalize column names
-            df.columns = df.columns.str.strip()
+                # Validate row (row 1 is the header)
+                if row_number < 2 or row_number > self._row_count + 1:
+                    logger.error("Invalid row number: %s", row_number)
+                    return False
 
-            # Ensure Status column exists
-            if 'Status' not in df.columns:
-                df['Status'] = ''
+                self._pending_status[row_number] = status
 
-            # Calculate DataFrame index (row_number - 2 because Excel is 1-indexed and has header)
-            df_index = row_number - 2
+                logger.info(f"✅ Updated row {row_number} status to '{status}' in {file_path}")
 
-            # Validate index
-            if df_index < 0 or df_index >= len(df):
-                logger.error(f"Invalid row number: {row_number}")
-                return False
+                if len(self._pending_status) >= self.STATUS_FLUSH_INTERVAL:
+                    return self.flush()
+                return True
 
-            # Update status
-            df.at[df_index, 'Status'] = status
+        except Exception as e:
+            logger.error("Error updating booking status: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Traceback: %s", traceback.format_exc())
+            return False
 
-            # Save back to Excel
-            df.to_excel(file_path, index=False)
+    def flush(self) -> bool:
+        """Write pending status updates into the Status cells of the Excel file.
 
-            logger.info(f"✅ Updated row {row_number} status to '{status}' in {file_path}")
-            return True
+        Only the Status cells change; other cells keep their values and formatting.
+
+        Returns:
+            True if there was nothing to write or the write succeeded, False otherwise
+        """
+        try:
+            with self._lock:
+                if not self._pending_status:
+                    return True
+
+                sheet, status_col = self._status_sheet()
+
+                changed = 0
+                for row_number, status in self._pending_status.items():
+                    cell = sheet.cell(row=row_number, column=status_col)
+                    if cell.value != status:
+                        cell.value = status
+                        changed += 1
+
+                # Re-marking a row with the status it already has needs no save
+                if not changed:
+                    self._pending_status.clear()
+                    return True
+
+                self._workbook.save(self._file_path)
+                self._saved_mtime = os.stat(self._file_path).st_mtime_ns
+                self._pending_status.clear()
+
+                logger.info(f"✅ Saved booking statuses to: {self._file_path}")
+                return True
 
         except Exception as e:
-            logger.error(f"Error updating booking status: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error saving booking statuses: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Traceback: %s", traceback.format_exc())
             return False
+
+    def close(self) -> bool:
+        """Write pending status updates and release the open workbook.
+
+        Returns:
+            True if pending updates were written, False otherwise
+        """
+        with self._lock:
+            flushed = self.flush()
+            if flushed:
+                self._workbook = None
+                self._sheet = None
+                self._status_col = None
+                self._saved_mtime = None
+            return flushed
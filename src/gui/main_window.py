@@ -4,25 +4,69 @@ Main GUI window for TNS Booking Uploader Bot.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import webbrowser
+import json
 import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
 from ..utils.logger import get_logger
 from ..utils.validators import Validator
-from ..excel.processor import ExcelProcessor
-from ..web.automation import WebAutomation
 
 logger = get_logger()
 
 
+@dataclass
+class BookingRow:
+    """Table state of one booking (one per row, so kept slotted)."""
+    __slots__ = ('index', 'status', 'booking')
+
+    index: int  # Index in processed_data
+    status: str  # 'pending', 'processing', 'done' or 'error'
+    booking: Dict[str, Any]
+
+
 class MainWindow:
     """Main application window using tkinter."""
 
-    ICABBI_PORTAL_URL = "https://silvertopcorporate.business.icabbi.com/trips/all-trips"
     WINDOW_TITLE = "TNS Booking Uploader Bot"
-    WINDOW_SIZE = "1400x700"  # Increased from 900x600
+    WINDOW_WIDTH = 1500  # Increased from 900, wide enough for the Action column
+    WINDOW_HEIGHT = 700
+
+    # Rows added to the bookings table at a time; the first page is shown at
+    # once and the rest are added in idle time, so Tk repaints between pages
+    RENDER_PAGE_SIZE = 200
+
+    # Milliseconds between progress bar animation steps while reading a workbook
+    PROGRESS_BUSY_INTERVAL_MS = 20
+
+    # Remembers the folder of the last selected file for the file dialog
+    LAST_DIR_FILE = Path.home() / ".tns_uploader" / "last_dir.json"
+
+    # Table text for each internal booking status
+    STATUS_TEXT = {
+        'pending': 'Pending',
+        'processing': 'Processing...',
+        'done': 'Done',
+        'error': 'Error'
+    }
+    ACTION_TEXT = {
+        'pending': "▶ Process",
+        'processing': "⏸ Processing...",
+        'done': "✓ Done",
+        'error': "⟳ Retry"
+    }
+
+    # Batch results are reported in the status bar; set to also show a popup
+    VERBOSE_POPUPS = False
+    COMPLETE_MESSAGE = (
+        "All {total} bookings have been processed!\n\n"
+        "✓ Successfully created: {done}\n"
+        "✗ Failed: {failed}\n\n"
+        "Check the Status column for details."
+    )
 
     def __init__(self):
         """Initialize the main window."""
@@ -31,14 +75,29 @@ class MainWindow:
         self.excel_processor = None
         self.web_automation = None
         self.processed_data = None
-        self.booking_statuses = {}  # Track status of each booking
+        self.booking_statuses = {}  # Track status of each booking (item ID -> BookingRow)
+        self.status_counts = Counter()  # Number of bookings in each status
+        self.index_to_item_id = {}  # processed_data index -> tree item ID
+
+        # Table rows are rendered from this cache (one values list per booking,
+        # in processed_data order); only the first _rendered_count are Treeview items
+        self.row_cache = []
+        self._rendered_count = 0
+        self._render_scheduled = False
 
         # Booking processing state
         self.bookings_to_process = []
         self.current_booking_index = 0
         self.total_bookings = 0
         self.is_processing = False  # Flag to track if processing is active
-        self.stop_processing = False  # Flag to stop processing
+        self._cancel_event = threading.Event()  # Set to stop processing
+
+        # Playwright's sync API only works on the thread that started it, so all
+        # browser work runs on this single automation thread (created on first use)
+        self._automation_executor = None
+
+        # Excel status writes run in order on their own thread (created on first use)
+        self._excel_executor = None
 
         # GUI components
         self.file_path_var = None
@@ -46,23 +105,30 @@ class MainWindow:
         self.progress_var = None
         self.bookings_tree = None
         self.clear_file_button = None
+        self._processor_preload = None
+        self._last_dir = None  # Folder of the last selected file, once known
+        self._progress_busy = False  # Progress bar is animating (step of unknown length)
+        self._last_status = None  # Text last written to status_var
+        self._last_percent = 0  # Value last written to progress_var
 
         self._setup_window()
         self._setup_components()
         self._configure_disabled_button_style()
+
+        # Once the window is drawn, load the Excel processor while the user picks a file
+        self.root.after_idle(self._start_processor_preload)
     
     def _setup_window(self):
         """Set up the main window properties."""
         self.root = tk.Tk()
         self.root.title(self.WINDOW_TITLE)
-        self.root.geometry(self.WINDOW_SIZE)
         self.root.resizable(True, True)
 
-        # Center the window on screen (increased width for Action column)
-        self.root.update_idletasks()
-        x = (self.root.winfo_screenwidth() // 2) - (1500 // 2)
-        y = (self.root.winfo_screenheight() // 2) - (700 // 2)
-        self.root.geometry(f"1500x700+{x}+{y}")
+        # Size and center the window in one geometry call; the screen size is
+        # available before the window is mapped
+        x = (self.root.winfo_screenwidth() // 2) - (self.WINDOW_WIDTH // 2)
+        y = (self.root.winfo_screenheight() // 2) - (self.WINDOW_HEIGHT // 2)
+        self.root.geometry(f"{self.WINDOW_WIDTH}x{self.WINDOW_HEIGHT}+{x}+{y}")
 
         # Set minimum size
         self.root.minsize(1300, 600)
@@ -187,7 +253,7 @@ class MainWindow:
         status_label.grid(row=0, column=0, sticky=(tk.W, tk.E))
 
         # Progress bar
-        self.progress_var = tk.DoubleVar()
+        self.progress_var = tk.IntVar()
         self.progress_bar = ttk.Progressbar(
             status_frame,
             variable=self.progress_var,
@@ -269,7 +335,8 @@ class MainWindow:
     
     def _configure_disabled_button_style(self):
         """Configure the style for disabled buttons to make them more visually obvious."""
-        style = ttk.Style()
+        # Styles belong to the Tk interpreter, so this runs once per window's root
+        style = ttk.Style(self.root)
 
         # Map the disabled state to use lighter colors and different appearance
         style.map(
@@ -279,52 +346,168 @@ class MainWindow:
             relief=[("disabled", "flat")]
         )
 
+    def _schedule_next_page(self):
+        """Render the next page of cached rows in idle time, if any remain."""
+        if self._rendered_count < len(self.row_cache) and not self._render_scheduled:
+            self._render_scheduled = True
+            self.root.after_idle(self._render_next_page)
+
+    def _render_next_page(self):
+        """Add the next RENDER_PAGE_SIZE cached rows to the bookings table."""
+        self._render_scheduled = False
+        self._render_rows(self._rendered_count + self.RENDER_PAGE_SIZE)
+        self._schedule_next_page()
+
+    def _render_rows(self, count: int):
+        """Make sure the first `count` cached rows exist as Treeview items."""
+        end = min(count, len(self.row_cache))
+        if end <= self._rendered_count:
+            return
+
+        # Build every row's insert arguments first so the insert loop only talks to Tk;
+        # the table is redrawn once, when control returns to the event loop
+        statuses = self.booking_statuses
+        rows = [
+            (f"row{idx}", self.row_cache[idx], statuses[f"row{idx}"].status)
+            for idx in range(self._rendered_count, end)
+        ]
+
+        # Call the Tcl insert command directly, skipping Treeview.insert's
+        # per-call option formatting (tkinter passes the values list as a Tcl list)
+        tk_call = self.bookings_tree.tk.call
+        tree = str(self.bookings_tree)
+        for item_id, values, status in rows:
+            tk_call(tree, "insert", "", "end", "-id", item_id, "-values", values, "-tags", status)
+
+        self._rendered_count = end
+
+    def _refresh_row(self, idx: int, status: Optional[str] = None):
+        """Push a cached row's action cell (and status cell and tag) to its Treeview item, if rendered.
+
+        Only these cells change after a row is rendered, so they are set one
+        column at a time instead of resending the whole row.
+        """
+        if idx >= self._rendered_count:
+            return
+
+        item_id = f"row{idx}"
+        values = self.row_cache[idx]
+        if status is not None:
+            self.bookings_tree.set(item_id, "status", values[-2])
+            self.bookings_tree.item(item_id, tags=(status,))
+        self.bookings_tree.set(item_id, "action", values[-1])
+
+    def _clear_table(self):
+        """Remove all rows from the bookings table and its row cache."""
+        self.bookings_tree.delete(*self.bookings_tree.get_children())
+        self.row_cache = []
+        self._rendered_count = 0
+
+    def _ask(self, kind: str, title: str, message: str, **options):
+        """Show a messagebox dialog (e.g. kind="askyesno") and return its result.
+
+        All prompts go through here; call it on the UI thread (workers report
+        back with root.after first).
+        """
+        return getattr(messagebox, kind)(title, message, **options)
+
+    def _show_popup(self, title: str, message: str, modal: bool = False) -> tk.Toplevel:
+        """Show a message in a small window without running a nested event loop.
+
+        The call returns at once; a modal popup grabs input until it is dismissed.
+        """
+        popup = tk.Toplevel(self.root)
+        popup.title(title)
+        popup.transient(self.root)
+        popup.resizable(False, False)
+
+        ttk.Label(popup, text=message, wraplength=420, justify=tk.LEFT, padding=15).pack(fill=tk.BOTH, expand=True)
+        ok_button = ttk.Button(popup, text="OK", command=popup.destroy)
+        ok_button.pack(pady=(0, 10))
+
+        ok_button.focus_set()
+        popup.bind("<Return>", lambda event: popup.destroy())
+        popup.bind("<Escape>", lambda event: popup.destroy())
+
+        if modal:
+            popup.grab_set()
+        return popup
+
+    def _show_info(self, title: str, message: str) -> tk.Toplevel:
+        """Show an information popup that doesn't block the window."""
+        return self._show_popup(title, message)
+
+    def _show_error(self, title: str, message: str) -> tk.Toplevel:
+        """Show an error popup that must be dismissed before using the window."""
+        return self._show_popup(title, message, modal=True)
+
     def _open_portal(self):
         """Open the iCabbi portal in Chrome or Edge browser."""
         try:
             self._update_status("Opening iCabbi portal...")
 
+            # Launching the browser takes a while; do it off the UI thread
+            self.portal_button.config(state="disabled")
+            self._submit_automation(self._open_portal_worker)
+
+        except Exception as e:
+            self.portal_button.config(state="normal")
+            self._on_portal_error(str(e))
+
+    def _open_portal_worker(self):
+        """Open the portal (runs on the automation thread)."""
+        try:
             if not self.web_automation:
                 from ..web.automation import WebAutomation
                 self.web_automation = WebAutomation()
 
             success = self.web_automation.open_portal_in_browser()
-
-            if success:
-                self._update_status("iCabbi portal opened in browser")
-            else:
-                error_msg = ("Could not open portal. Please install Chrome or Microsoft Edge browser.\n\n"
-                           "Chrome: https://www.google.com/chrome/\n"
-                           "Edge: https://www.microsoft.com/edge/")
-                self._update_status("Error: No preferred browser found")
-                messagebox.showerror("Browser Required", error_msg)
+            self.root.after(0, self._on_portal_opened, success)
 
         except Exception as e:
-            error_msg = f"Failed to open iCabbi portal: {str(e)}"
-            logger.error(error_msg)
-            self._update_status("Error opening portal")
-            messagebox.showerror("Error", error_msg)
+            self.root.after(0, self._on_portal_error, str(e))
+
+    def _on_portal_opened(self, success: bool):
+        """Report the result of opening the portal."""
+        self.portal_button.config(state="normal")
+
+        if success:
+            self._update_status("iCabbi portal opened in browser")
+        else:
+            error_msg = ("Could not open portal. Please install Chrome or Microsoft Edge browser.\n\n"
+                       "Chrome: https://www.google.com/chrome/\n"
+                       "Edge: https://www.microsoft.com/edge/")
+            self._update_status("Error: No preferred browser found")
+            self._show_error("Browser Required", error_msg)
+
+    def _on_portal_error(self, error: str):
+        """Report a failure to open the portal."""
+        self.portal_button.config(state="normal")
+        error_msg = f"Failed to open iCabbi portal: {error}"
+        logger.error(error_msg)
+        self._update_status("Error opening portal")
+        self._show_error("Error", error_msg)
 
     def _start_creating_bookings(self):
         """Handle Start Processing Bookings button click."""
         try:
             # Check if Excel file is loaded
             if not self.selected_file_path:
-                messagebox.showwarning("No File Selected", "Please select a booking file first using 'Select Booking File'.")
+                self._ask("showwarning", "No File Selected", "Please select a booking file first using 'Select Booking File'.")
                 return
 
             logger.info(f"Starting booking creation with file: {self.selected_file_path}")
             logger.info(f"Number of bookings in processed_data: {len(self.processed_data) if self.processed_data else 0}")
 
             # Check if Excel data is processed
-            if not hasattr(self, 'processed_data') or not self.processed_data:
-                messagebox.showwarning("No Data", "Please wait for the file to be processed first.")
+            if not self.processed_data:
+                self._ask("showwarning", "No Data", "Please wait for the file to be processed first.")
                 return
 
             # Check if web automation is initialized (browser opened)
-            if not self.web_automation or not hasattr(self.web_automation, 'page') or not self.web_automation.page:
-                messagebox.showwarning("Browser Not Open",
-                                     "Please open the iCabbi portal first by clicking 'Open iCabbi Portal'.")
+            if not self.web_automation or not self.web_automation.page:
+                self._ask("showwarning", "Browser Not Open",
+                          "Please open the iCabbi portal first by clicking 'Open iCabbi Portal'.")
                 return
 
             self._update_status("Starting booking creation process...")
@@ -333,31 +516,26 @@ class MainWindow:
             self.create_bookings_button.config(state="disabled")
             self.stop_button.config(state="normal")
 
-            # Get valid bookings
-            valid_bookings = [row for row in self.processed_data if row.get('is_valid', False)]
+            # Get valid bookings, keeping their processed_data index (the table row)
+            valid_bookings = [
+                (idx, row) for idx, row in enumerate(self.processed_data) if row.get('is_valid', False)
+            ]
 
             if not valid_bookings:
                 self._on_booking_error("No valid bookings found")
                 return
 
             # Filter out already processed bookings (status = 'done')
-            bookings_to_process = []
-            for idx, booking in enumerate(valid_bookings):
-                # Check if this booking is already done
-                is_done = False
-                for item_id, info in self.booking_statuses.items():
-                    if info['index'] == idx and info['status'] == 'done':
-                        is_done = True
-                        break
-
-                if not is_done:
-                    bookings_to_process.append((idx, booking))
+            bookings_to_process = [
+                (idx, booking) for idx, booking in valid_bookings
+                if self.booking_statuses[self.index_to_item_id[idx]].status != 'done'
+            ]
 
             if not bookings_to_process:
                 self._update_status("All bookings already processed!")
                 self.create_bookings_button.config(state="normal")
                 self.stop_button.config(state="disabled")
-                messagebox.showinfo("Complete", "All bookings have already been processed!")
+                self._show_info("Complete", "All bookings have already been processed!")
                 return
 
             # Store bookings to process
@@ -365,144 +543,108 @@ class MainWindow:
             self.current_booking_index = 0
             self.total_bookings = len(bookings_to_process)
             self.is_processing = True
-            self.stop_processing = False
+            self._cancel_event.clear()
 
             # Disable all action buttons during batch processing
             self._disable_all_action_buttons()
 
             logger.info(f"Starting to process {self.total_bookings} bookings (skipping {len(valid_bookings) - self.total_bookings} already done)")
 
-            # Start processing first booking (on main thread)
-            self.root.after(100, self._process_next_booking)
+            # Create the bookings on the automation thread; the UI stays responsive
+            self._submit_automation(self._run_booking_creation, bookings_to_process)
 
         except Exception as e:
             error_msg = f"Error starting booking creation: {str(e)}"
             logger.error(error_msg)
             self._update_status("Error starting booking creation")
-            messagebox.showerror("Error", error_msg)
+            self._show_error("Error", error_msg)
             self.create_bookings_button.config(state="normal")
 
-    def _process_next_booking(self):
-        """Process the next booking in the queue (runs on main thread)."""
-        try:
-            # Check if stop was requested
-            if self.stop_processing:
-                self._on_processing_stopped()
-                return
-
-            # Check if we're done
-            if self.current_booking_index >= self.total_bookings:
-                self._on_all_bookings_complete(self.total_bookings)
-                return
-
-            # Get the actual booking index and data
-            actual_index, booking = self.bookings_to_process[self.current_booking_index]
-
-            # Update status to Processing
-            self._update_booking_status(actual_index, 'processing')
-            self._update_status(f"Processing booking {self.current_booking_index + 1} of {self.total_bookings}...")
-
-            logger.info(f"Processing booking {self.current_booking_index + 1} of {self.total_bookings} (actual index: {actual_index})")
-
-            # Process events to allow UI interaction (Stop button)
-            self.root.update_idletasks()
-            self.root.update()
+    def _submit_automation(self, func, *args):
+        """Run func on the automation thread that owns the browser."""
+        if self._automation_executor is None:
+            self._automation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="automation")
+        return self._automation_executor.submit(func, *args)
 
-            # Start the booking creation in chunks to keep UI responsive
-            # We'll use a callback-based approach
-            self._start_single_booking(actual_index, booking)
+    def _run_booking_creation(self, bookings_to_process):
+        """Create the given bookings one by one (runs on the automation thread).
 
-        except Exception as e:
-            error_msg = f"Error processing booking {self.current_booking_index + 1}: {str(e)}"
-            logger.error(error_msg)
-
-            # Get actual index for error status
-            if self.current_booking_index < len(self.bookings_to_process):
-                actual_index, _ = self.bookings_to_process[self.current_booking_index]
-                self._update_booking_status(actual_index, 'error')
-
-            # Continue with next booking
-            self.current_booking_index += 1
-            self.root.after(500, self._process_next_booking)
-
-    def _start_single_booking(self, actual_index, booking):
-        """Start processing a single booking with periodic UI updates."""
-        # Schedule the actual booking creation to run after a brief delay
-        # This allows the UI to process the status update first
-        self.root.after(100, self._execute_single_booking, actual_index, booking)
-
-    def _execute_single_booking(self, actual_index, booking):
-        """Execute the booking creation with periodic UI responsiveness checks."""
+        UI updates are handed back to the main thread with root.after.
+        """
+        total = len(bookings_to_process)
         try:
-            # Set up a callback for the web automation to call periodically
-            def ui_update_callback():
-                """Called periodically during booking creation to keep UI responsive."""
-                self.root.update_idletasks()
-                self.root.update()
-                return self.stop_processing  # Return True if stop was requested
+            # Stop requests are checked from the automation thread via the event
+            self.web_automation.set_ui_callback(self._cancel_event.is_set)
 
-            # Pass the callback to web automation
-            self.web_automation.set_ui_callback(ui_update_callback)
-
-            # Create the booking
-            success = self.web_automation.create_single_booking(booking)
-
-            # Clear the callback
-            self.web_automation.set_ui_callback(None)
-
-            # Update status based on result
-            if success:
-                self._update_booking_status(actual_index, 'done')
-                logger.info(f"Booking {self.current_booking_index + 1} completed successfully")
-            else:
-                self._update_booking_status(actual_index, 'error')
-                logger.error(f"Booking {self.current_booking_index + 1} failed")
+            for position, (actual_index, booking) in enumerate(bookings_to_process):
+                if self._cancel_event.is_set():
+                    break
 
-            # Process events to keep UI responsive
-            self.root.update_idletasks()
-            self.root.update()
+                self.root.after(0, self._on_booking_started, actual_index, position, total)
+                logger.info(f"Processing booking {position + 1} of {total} (actual index: {actual_index})")
 
-            # Update progress
-            progress = ((self.current_booking_index + 1) / self.total_bookings) * 100
-            self._update_progress(progress)
+                try:
+                    success = self.web_automation.create_single_booking(booking)
+                except Exception as e:
+                    logger.error("Error executing booking %s: %s", position + 1, e)
+                    success = False
 
-            # Move to next booking
-            self.current_booking_index += 1
+                self.root.after(0, self._on_booking_done, actual_index, success, position, total)
 
-            # Schedule next booking (small delay to allow UI updates)
-            self.root.after(500, self._process_next_booking)
+            if self._cancel_event.is_set():
+                self.root.after(0, self._on_processing_stopped)
+            else:
+                self.root.after(0, self._on_all_bookings_complete, total)
 
         except Exception as e:
-            error_msg = f"Error executing booking {self.current_booking_index + 1}: {str(e)}"
-            logger.error(error_msg)
+            logger.error("Error processing bookings: %s", e)
+            self.root.after(0, self._on_booking_error, f"Error processing bookings: {str(e)}")
+        finally:
+            if self.web_automation:
+                self.web_automation.set_ui_callback(None)
+
+    def _on_booking_started(self, actual_index: int, position: int, total: int):
+        """Show that a booking from the batch is being created."""
+        self._update_booking_status(actual_index, 'processing')
+        self._update_status(f"Processing booking {position + 1} of {total}...")
+
+    def _on_booking_done(self, actual_index: int, success: bool, position: int, total: int):
+        """Record the result of a booking from the batch."""
+        if success:
+            self._update_booking_status(actual_index, 'done')
+            logger.info(f"Booking {position + 1} completed successfully")
+        else:
             self._update_booking_status(actual_index, 'error')
+            logger.error("Booking %s failed", position + 1)
 
-            # Continue with next booking
-            self.current_booking_index += 1
-            self.root.after(500, self._process_next_booking)
+        self.current_booking_index = position + 1
+        self._update_progress((self.current_booking_index / total) * 100)
 
     def _stop_processing(self):
         """Handle Stop Processing button click."""
         if self.is_processing:
-            self.stop_processing = True
+            self._cancel_event.set()
             self._update_status("Stopping after current booking...")
             logger.info("User requested to stop processing")
 
     def _on_processing_stopped(self):
         """Handle when processing is stopped by user."""
         self.is_processing = False
-        self.stop_processing = False
+        self._cancel_event.clear()
         self.create_bookings_button.config(state="normal")
         self.stop_button.config(state="disabled")
 
         # Re-enable all action buttons
         self._enable_all_action_buttons()
 
+        # Save statuses of the bookings processed so far
+        self._flush_excel_status()
+
         # Count completed bookings
-        completed = sum(1 for _, info in self.booking_statuses.items() if info['status'] == 'done')
+        completed = self.status_counts['done']
 
         self._update_status(f"Processing stopped. {completed} bookings completed.")
-        messagebox.showinfo("Stopped",
+        self._show_info("Stopped",
             f"Processing stopped by user.\n\n"
             f"{completed} bookings completed.\n"
             "You can resume by clicking 'Start Processing Bookings' again.\n"
@@ -511,41 +653,46 @@ class MainWindow:
     def _on_all_bookings_complete(self, total_bookings: int):
         """Handle completion of all bookings."""
         self.is_processing = False
-        self.stop_processing = False
-        self._update_status(f"All {total_bookings} bookings processed!")
+        self._cancel_event.clear()
         self.create_bookings_button.config(state="normal")
         self.stop_button.config(state="disabled")
 
         # Re-enable all action buttons
         self._enable_all_action_buttons()
 
+        # Save statuses of the processed bookings
+        self._flush_excel_status()
+
         # Count successes and failures
-        done_count = sum(1 for _, info in self.booking_statuses.items() if info['status'] == 'done')
-        error_count = sum(1 for _, info in self.booking_statuses.items() if info['status'] == 'error')
+        done_count = self.status_counts['done']
+        error_count = self.status_counts['error']
 
-        messagebox.showinfo("Complete",
-            f"All {total_bookings} bookings have been processed!\n\n"
-            f"✓ Successfully created: {done_count}\n"
-            f"✗ Failed: {error_count}\n\n"
-            "Check the Status column for details.")
+        self._update_status(
+            f"All {total_bookings} bookings processed! ✓ {done_count} created, ✗ {error_count} failed"
+        )
+        if self.VERBOSE_POPUPS:
+            self._show_info("Complete", self.COMPLETE_MESSAGE.format(
+                total=total_bookings, done=done_count, failed=error_count))
 
     def _on_booking_error(self, error_msg: str):
         """Handle booking processing error."""
         self.is_processing = False
-        self.stop_processing = False
+        self._cancel_event.clear()
         self._update_status("Error processing bookings")
         self.create_bookings_button.config(state="normal")
 
         # Re-enable all action buttons
         self._enable_all_action_buttons()
         self.stop_button.config(state="disabled")
-        messagebox.showerror("Booking Error", error_msg)
+        self._flush_excel_status()
+        self._show_error("Booking Error", error_msg)
 
     def _clear_file(self):
         """Handle Clear File button click."""
         try:
             # Ask for confirmation
-            result = messagebox.askyesno(
+            result = self._ask(
+                "askyesno",
                 "Clear File",
                 "This will clear the loaded file and all booking data.\n\nAre you sure?"
             )
@@ -558,17 +705,18 @@ class MainWindow:
                 # Clear processed data
                 self.processed_data = None
                 self.booking_statuses = {}
+                self.status_counts = Counter()
+                self.index_to_item_id = {}
 
                 # Reset processing state
                 self.bookings_to_process = []
                 self.current_booking_index = 0
                 self.total_bookings = 0
                 self.is_processing = False
-                self.stop_processing = False
+                self._cancel_event.clear()
 
                 # Clear table
-                for item in self.bookings_tree.get_children():
-                    self.bookings_tree.delete(item)
+                self._clear_table()
 
                 # Disable buttons
                 self.create_bookings_button.config(state="disabled")
@@ -585,13 +733,14 @@ class MainWindow:
             error_msg = f"Error clearing file: {str(e)}"
             logger.error(error_msg)
             self._update_status("Error clearing file")
-            messagebox.showerror("Error", error_msg)
+            self._show_error("Error", error_msg)
 
     def _clear_browser_state(self):
         """Handle Clear Browser State button click."""
         try:
             # Ask for confirmation with detailed message
-            result = messagebox.askyesno(
+            result = self._ask(
+                "askyesno",
                 "Clear Browser State",
                 "This will completely clear:\n\n"
                 "• Saved login credentials\n"
@@ -605,31 +754,51 @@ class MainWindow:
             if result:
                 logger.info("User confirmed browser state clearing")
 
-                if self.web_automation:
-                    self.web_automation.clear_browser_state()
-                else:
-                    # Clear state file directly if automation not initialized
-                    from ..web.automation import WebAutomation
-                    temp_automation = WebAutomation()
-                    temp_automation.clear_browser_state()
-
-                self._update_status("Browser state cleared successfully")
-                messagebox.showinfo(
-                    "Success",
-                    "Browser state cleared successfully!\n\n"
-                    "✓ Login credentials removed\n"
-                    "✓ Cookies deleted\n"
-                    "✓ Sessions cleared\n"
-                    "✓ Cache cleared\n\n"
-                    "You'll need to login again next time you open the portal."
-                )
-                logger.info("Browser state cleared successfully")
+                # Closing the browser has to happen on the automation thread
+                self.clear_state_button.config(state="disabled")
+                self._update_status("Clearing browser state...")
+                self._submit_automation(self._clear_browser_state_worker)
 
         except Exception as e:
-            error_msg = f"Error clearing browser state: {str(e)}"
-            logger.error(error_msg)
-            self._update_status("Error clearing browser state")
-            messagebox.showerror("Error", f"Failed to clear browser state:\n\n{error_msg}")
+            self._on_browser_state_error(str(e))
+
+    def _clear_browser_state_worker(self):
+        """Close the browser and delete its saved state (runs on the automation thread)."""
+        try:
+            if self.web_automation:
+                self.web_automation.clear_browser_state()
+            else:
+                # No browser to close, so just delete the saved state files
+                from ..web.automation import WebAutomation
+                WebAutomation.clear_state_files()
+
+            self.root.after(0, self._on_browser_state_cleared)
+
+        except Exception as e:
+            self.root.after(0, self._on_browser_state_error, str(e))
+
+    def _on_browser_state_cleared(self):
+        """Confirm that the browser state was cleared."""
+        self.clear_state_button.config(state="normal")
+        self._update_status("Browser state cleared successfully")
+        self._show_info(
+            "Success",
+            "Browser state cleared successfully!\n\n"
+            "✓ Login credentials removed\n"
+            "✓ Cookies deleted\n"
+            "✓ Sessions cleared\n"
+            "✓ Cache cleared\n\n"
+            "You'll need to login again next time you open the portal."
+        )
+        logger.info("Browser state cleared successfully")
+
+    def _on_browser_state_error(self, error: str):
+        """Report a failure to clear the browser state."""
+        self.clear_state_button.config(state="normal")
+        error_msg = f"Error clearing browser state: {error}"
+        logger.error(error_msg)
+        self._update_status("Error clearing browser state")
+        self._show_error("Error", f"Failed to clear browser state:\n\n{error_msg}")
 
     def _start_upload(self):
         """Start the booking upload process."""
@@ -644,7 +813,7 @@ class MainWindow:
                     ("Excel files", "*.xlsx *.xls"),
                     ("All files", "*.*")
                 ],
-                initialdir=str(Path.home())
+                initialdir=self._last_dir or self._load_last_dir()
             )
 
             if not file_path:
@@ -654,12 +823,16 @@ class MainWindow:
 
             logger.info(f"User selected file: {file_path}")
 
-            # Validate file
-            if not Validator.is_valid_excel_file(file_path):
+            # Open the next dialog here without re-reading the saved folder
+            self._last_dir = str(Path(file_path).parent)
+
+            # Only check the extension here; the background thread does the full
+            # file check (which touches the disk) before reading the workbook
+            if not Validator.has_excel_extension(file_path):
                 error_msg = "Invalid Excel file selected"
                 logger.error(error_msg)
                 self._update_status("Invalid file selected")
-                messagebox.showerror("Invalid File", error_msg)
+                self._show_error("Invalid File", error_msg)
                 return
 
             # Update UI with selected file
@@ -670,8 +843,10 @@ class MainWindow:
             # Enable the Start Processing Bookings button
             self.create_bookings_button.config(state="normal")
 
-            # Process file in background thread
+            # Process file in background thread; no second file until this one is done
+            self.upload_button.config(state="disabled")
             self._update_status("Processing Excel file...")
+            self._update_progress(0)
             logger.info(f"Starting background thread to process file: {file_path}")
             threading.Thread(
                 target=self._process_excel_file,
@@ -683,97 +858,157 @@ class MainWindow:
             error_msg = f"Error starting upload process: {str(e)}"
             logger.error(error_msg)
             self._update_status("Error starting upload")
-            messagebox.showerror("Error", error_msg)
+            self._show_error("Error", error_msg)
     
+    def _load_last_dir(self) -> str:
+        """Return the folder of the last selected file, or the home folder."""
+        try:
+            with open(self.LAST_DIR_FILE, 'r') as f:
+                last_dir = json.load(f).get('last_dir')
+            if last_dir and Path(last_dir).is_dir():
+                return last_dir
+        except (OSError, ValueError, AttributeError):
+            pass
+        return str(Path.home())
+
+    def _save_last_dir(self, directory: str):
+        """Remember the folder of the selected file for the next file dialog."""
+        try:
+            self.LAST_DIR_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.LAST_DIR_FILE, 'w') as f:
+                json.dump({'last_dir': directory}, f)
+        except OSError as e:
+            logger.warning("Could not save last used folder: %s", e)
+
+    def _start_processor_preload(self):
+        """Create the Excel processor (and import pandas/openpyxl) in a background thread."""
+        self._processor_preload = threading.Thread(target=self._preload_processor, daemon=True)
+        self._processor_preload.start()
+
+    def _preload_processor(self):
+        """Create the Excel processor ahead of the first file (runs in background thread)."""
+        try:
+            from ..excel.processor import ExcelProcessor
+            self.excel_processor = ExcelProcessor(cache_dir=ExcelProcessor.DISK_CACHE_DIR)
+        except Exception as e:
+            logger.warning("Could not preload Excel processor: %s", e)
+
     def _process_excel_file(self, file_path: str):
         """Process the selected Excel file (runs in background thread)."""
         try:
             logger.info(f"_process_excel_file called with file_path: {file_path}")
 
+            # Remember the folder here rather than on the UI thread, since it writes a file
+            self._save_last_dir(str(Path(file_path).parent))
+
+            # Use the preloaded processor (waiting for it if it's still loading)
+            if self._processor_preload is not None:
+                self._processor_preload.join()
+
             # Initialize Excel processor if needed
             if not self.excel_processor:
-                self.excel_processor = ExcelProcessor()
+                from ..excel.processor import ExcelProcessor
+                self.excel_processor = ExcelProcessor(cache_dir=ExcelProcessor.DISK_CACHE_DIR)
 
             # Process the file
             logger.info(f"Calling excel_processor.process_file with: {file_path}")
-            result = self.excel_processor.process_file(file_path)
+            result = self.excel_processor.process_file(
+                file_path,
+                progress_callback=lambda fraction: self.root.after(0, self._on_file_progress, fraction)
+            )
+
+            # Format the table rows here so the main thread only inserts them
+            rows, statuses = self._format_rows(result.data) if result.success else ([], [])
 
             # Update UI on main thread
-            self.root.after(0, self._on_file_processed, result)
+            self.root.after(0, self._on_file_processed, result, rows, statuses)
 
         except Exception as e:
             error_msg = f"Error processing Excel file '{file_path}': {str(e)}"
             logger.error(error_msg)
             self.root.after(0, self._on_processing_error, error_msg)
     
-    def _on_file_processed(self, result):
-        """Handle successful file processing (runs on main thread)."""
+    def _format_rows(self, bookings):
+        """Format processed bookings for the table (runs in background thread).
+
+        Returns:
+            Tuple of (table values per booking, internal status per booking)
+        """
+        rows = []
+        statuses = []
+
+        # Bind the lookups used on every row once, outside the loop
+        add_row = rows.append
+        add_status = statuses.append
+        status_text = self.STATUS_TEXT
+        action_text = self.ACTION_TEXT
+
+        for booking in bookings:
+            get = booking.get
+
+            # Note: Excel processor returns capitalized keys (Date, Time, Driver, Mobile, From, To)
+            date_str = get('Date', 'N/A')
+            if hasattr(date_str, 'strftime'):
+                date_str = date_str.strftime('%d/%m/%Y')
+
+            time_str = get('Time', 'N/A')
+            if hasattr(time_str, 'strftime'):
+                time_str = time_str.strftime('%H:%M')
+
+            # Get mobile number (optional field)
+            mobile = get('Mobile', '')
+            mobile_str = str(mobile) if mobile else ''
+            mobile_str = mobile_str.strip() if mobile_str.lower() != 'nan' else ''
+
+            # Determine status and action button based on existing status in the Excel file
+            existing_status = get('Status', '')
+            if existing_status and str(existing_status).strip().lower() == 'done':
+                internal_status = 'done'
+            else:
+                internal_status = 'pending'
+
+            add_row([
+                date_str, time_str, get('Driver', 'N/A'), mobile_str,
+                get('From', 'N/A'), get('To', 'N/A'),
+                status_text[internal_status], action_text[internal_status]
+            ])
+            add_status(internal_status)
+
+        return rows, statuses
+
+    def _on_file_processed(self, result, rows, statuses):
+        """Handle successful file processing (runs on main thread).
+
+        Args:
+            result: ProcessingResult from the Excel processor
+            rows: Table values per booking, from _format_rows
+            statuses: Internal status per booking, from _format_rows
+        """
         try:
+            self.upload_button.config(state="normal")
+
             if result.success:
                 # Store processed data for booking creation
                 self.processed_data = result.data
 
                 # Clear existing table data
-                for item in self.bookings_tree.get_children():
-                    self.bookings_tree.delete(item)
+                self._clear_table()
 
-                # Populate table with bookings
-                self.booking_statuses = {}
-                for idx, booking in enumerate(result.data):
-                    # Format date and time for display
-                    # Note: Excel processor returns capitalized keys (Date, Time, Driver, Mobile, From, To)
-                    date_str = booking.get('Date', 'N/A')
-                    if hasattr(date_str, 'strftime'):
-                        date_str = date_str.strftime('%d/%m/%Y')
-
-                    time_str = booking.get('Time', 'N/A')
-                    if hasattr(time_str, 'strftime'):
-                        time_str = time_str.strftime('%H:%M')
-
-                    driver = booking.get('Driver', 'N/A')
-
-                    # Get mobile number (optional field)
-                    mobile = booking.get('Mobile', '')
-                    if mobile and str(mobile).strip() and str(mobile).lower() != 'nan':
-                        mobile_str = str(mobile).strip()
-                    else:
-                        mobile_str = ''
-
-                    from_loc = booking.get('From', 'N/A')
-                    to_loc = booking.get('To', 'N/A')
-
-                    # Get existing status from Excel file
-                    existing_status = booking.get('Status', '')
-
-                    # Determine status and action button based on existing status
-                    if existing_status and str(existing_status).strip().lower() == 'done':
-                        status_display = "Done"
-                        action_display = "✓ Done"
-                        status_tag = "done"
-                        internal_status = 'done'
-                    else:
-                        status_display = "Pending"
-                        action_display = "▶ Process"
-                        status_tag = "pending"
-                        internal_status = 'pending'
-
-                    # Insert into table with status from Excel file
-                    item_id = self.bookings_tree.insert(
-                        "",
-                        tk.END,
-                        values=(date_str, time_str, driver, mobile_str, from_loc, to_loc, status_display, action_display),
-                        tags=(status_tag,)
-                    )
-
-                    # Track status by item ID
-                    self.booking_statuses[item_id] = {
-                        'index': idx,
-                        'status': internal_status,
-                        'booking': booking
-                    }
+                # Populate table with the rows formatted by the background thread
+                self.row_cache = rows
+                self.booking_statuses = {
+                    f"row{idx}": BookingRow(idx, status, booking)
+                    for idx, (status, booking) in enumerate(zip(statuses, result.data))
+                }
+                self.status_counts = Counter(statuses)
+                self.index_to_item_id = {idx: f"row{idx}" for idx in range(len(rows))}
+
+                # Show the first page now and stream in the rest
+                self._render_rows(self.RENDER_PAGE_SIZE)
+                self._schedule_next_page()
 
                 # Count already completed bookings
-                already_done = sum(1 for info in self.booking_statuses.values() if info['status'] == 'done')
+                already_done = self.status_counts['done']
 
                 status_msg = f"File processed successfully. {result.row_count} bookings loaded."
                 if already_done > 0:
@@ -795,7 +1030,7 @@ class MainWindow:
                     success_msg += f"\n\n✓ Already completed: {already_done}\n"
                     success_msg += f"⏳ Pending: {result.row_count - already_done}"
 
-                messagebox.showinfo("Success", success_msg)
+                self._show_info("Success", success_msg)
 
             else:
                 # Clear processed data on failure and disable button
@@ -804,27 +1039,58 @@ class MainWindow:
                 self.clear_file_button.config(state="disabled")
                 error_msg = f"File processing failed: {result.error_message or 'Unknown error'}"
                 self._update_status("File processing failed")
-                messagebox.showerror("Processing Error", error_msg)
+                self._update_progress(0)
+                self._show_error("Processing Error", error_msg)
                 logger.error(error_msg)
 
         except Exception as e:
-            logger.error(f"Error handling file processing result: {str(e)}")
+            logger.error("Error handling file processing result: %s", e)
     
     def _on_processing_error(self, error_msg: str):
         """Handle file processing error (runs on main thread)."""
+        self.upload_button.config(state="normal")
         self.create_bookings_button.config(state="disabled")
         self._update_status("File processing failed")
-        messagebox.showerror("Processing Error", error_msg)
+        self._update_progress(0)
+        self._show_error("Processing Error", error_msg)
     
     def _update_status(self, message: str):
         """Update the status display."""
-        self.status_var.set(message)
-        self.root.update_idletasks()
+        # Skip repeats so the label isn't redrawn for unchanged text; compare
+        # with a Python copy, since reading the StringVar is a Tcl call too
+        if message != self._last_status:
+            self._last_status = message
+            self.status_var.set(message)
     
+    def _on_file_progress(self, fraction: float):
+        """Show Excel processing progress (0.0 means the workbook read has started)."""
+        if fraction == 0:
+            # The read is the slow step and reports nothing until it ends,
+            # so animate the bar rather than leave it sitting at 0%
+            self._show_progress_busy()
+        else:
+            self._update_progress(fraction * 100)
+
+    def _show_progress_busy(self):
+        """Animate the progress bar until the next _update_progress call."""
+        if not self._progress_busy:
+            self._progress_busy = True
+            self.progress_bar.config(mode="indeterminate")
+            self.progress_bar.start(self.PROGRESS_BUSY_INTERVAL_MS)
+
     def _update_progress(self, value: float):
         """Update the progress bar."""
-        self.progress_var.set(value)
-        self.root.update_idletasks()
+        percent = int(value)
+        if self._progress_busy:
+            # The animation moved the bar, so always set the real value afterwards
+            self._progress_busy = False
+            self.progress_bar.stop()
+            self.progress_bar.config(mode="determinate")
+        # Whole percent steps; skip sets that wouldn't move the bar
+        elif percent == self._last_percent:
+            return
+        self._last_percent = percent
+        self.progress_var.set(percent)
 
     def _update_booking_status(self, booking_index: int, status: str):
         """Update the status of a booking in the table and Excel file.
@@ -835,84 +1101,92 @@ class MainWindow:
         """
         try:
             # Find the tree item for this booking
-            for item_id, info in self.booking_statuses.items():
-                if info['index'] == booking_index:
-                    # Update status in tracking dict
-                    info['status'] = status
-
-                    # Get current values
-                    values = list(self.bookings_tree.item(item_id, 'values'))
-
-                    # Update status column (second to last column)
-                    status_text = {
-                        'pending': 'Pending',
-                        'processing': 'Processing...',
-                        'done': 'Done',
-                        'error': 'Error'
-                    }.get(status, status)
-
-                    values[-2] = status_text  # Status is second to last (action is last)
-
-                    # Update action column based on status
-                    if status == 'done':
-                        values[-1] = "✓ Done"
-                    elif status == 'error':
-                        values[-1] = "⟳ Retry"
-                    elif status == 'processing':
-                        values[-1] = "⏸ Processing..."
-                    else:  # pending
-                        values[-1] = "▶ Process"
-
-                    # Update tree item with new values and tag
-                    self.bookings_tree.item(item_id, values=values, tags=(status,))
-
-                    # Scroll to the item
-                    self.bookings_tree.see(item_id)
+            item_id = self.index_to_item_id.get(booking_index)
+            if item_id is None:
+                return
+            info = self.booking_statuses[item_id]
 
-                    # Update UI
-                    self.root.update_idletasks()
+            # Update status in tracking dict and the per-status counts
+            self.status_counts[info.status] -= 1
+            self.status_counts[status] += 1
+            info.status = status
 
-                    # Update Excel file with status (only for done/error, not processing)
-                    if status in ['done', 'error'] and self.selected_file_path:
-                        booking = info['booking']
-                        row_number = booking.get('row_number', booking_index + 2)
-                        excel_status = 'Done' if status == 'done' else 'Error'
+            # Get current values
+            values = self.row_cache[booking_index]
 
-                        # Update Excel file in background thread to avoid blocking UI
-                        threading.Thread(
-                            target=self._update_excel_status,
-                            args=(self.selected_file_path, row_number, excel_status),
-                            daemon=True
-                        ).start()
+            # Update status column (second to last column)
+            values[-2] = self.STATUS_TEXT.get(status, status)  # Status is second to last (action is last)
 
-                    break
+            # Update action column based on status
+            values[-1] = self.ACTION_TEXT.get(status, self.ACTION_TEXT['pending'])
+
+            # Follow the booking being worked on: render its page and scroll to it
+            # if it isn't already visible. Done/error updates leave the view alone
+            if status == 'processing':
+                self._render_rows(booking_index + 1)
+                if not self.bookings_tree.bbox(item_id):
+                    self.bookings_tree.see(item_id)
+
+            # Update tree item with new values and tag (unrendered rows pick them
+            # up from the row cache when their page is rendered)
+            self._refresh_row(booking_index, status)
+
+            # Update Excel file with status (only for done/error, not processing)
+            if status in ['done', 'error'] and self.selected_file_path:
+                booking = info.booking
+                row_number = booking.get('row_number', booking_index + 2)
+                excel_status = 'Done' if status == 'done' else 'Error'
+
+                # Update Excel file in background thread to avoid blocking UI
+                self._submit_excel(self._update_excel_status,
+                                   self.selected_file_path, row_number, excel_status)
 
         except Exception as e:
-            logger.error(f"Error updating booking status: {str(e)}")
+            logger.error("Error updating booking status: %s", e)
 
     def _update_excel_status(self, file_path: str, row_number: int, status: str):
         """Update the status in the Excel file (runs in background thread)."""
         try:
-            if self.excel_processor:
-                self.excel_processor.update_booking_status(file_path, row_number, status)
+            if self.excel_processor and self.excel_processor.update_booking_status(file_path, row_number, status):
+                # Save each Done/Error mark at once: a mark lost to a crash would
+                # submit that booking to the portal again when the file is resumed
+                self.excel_processor.flush()
         except Exception as e:
-            logger.error(f"Error updating Excel status: {str(e)}")
+            logger.error("Error updating Excel status: %s", e)
+
+    def _flush_excel_status(self):
+        """Write pending status updates to the Excel file in a background thread."""
+        if self.excel_processor:
+            self._submit_excel(self.excel_processor.flush)
+
+    def _submit_excel(self, func, *args):
+        """Run func on the Excel status thread, after any status work already queued."""
+        if self._excel_executor is None:
+            self._excel_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="excel")
+        return self._excel_executor.submit(func, *args)
+
+    def _shutdown_excel(self):
+        """Finish queued status writes, then save and release the workbook."""
+        if self._excel_executor:
+            self._excel_executor.shutdown(wait=True)
+            self._excel_executor = None
+        if self.excel_processor:
+            self.excel_processor.close()
 
     def _on_tree_click(self, event):
         """Handle clicks on the treeview to detect action button clicks."""
         try:
-            # Identify the region clicked
-            region = self.bookings_tree.identify_region(event.x, event.y)
-            if region != "cell":
-                return
-
-            # Get the column clicked
+            # Check the column first: most clicks miss the action column
+            # (last column, #8), so they return after a single Tk call
             column = self.bookings_tree.identify_column(event.x)
-
-            # Check if it's the action column (last column, #8)
             if column != "#8":
                 return
 
+            # Identify the region clicked (headings and separators aren't cells)
+            region = self.bookings_tree.identify_region(event.x, event.y)
+            if region != "cell":
+                return
+
             # Get the item clicked
             item_id = self.bookings_tree.identify_row(event.y)
             if not item_id:
@@ -920,7 +1194,8 @@ class MainWindow:
 
             # Check if we're already processing
             if self.is_processing:
-                messagebox.showwarning(
+                self._ask(
+                    "showwarning",
                     "Processing in Progress",
                     "Another booking is currently being processed.\n\n"
                     "Please wait for it to complete or click 'Stop Processing'."
@@ -932,19 +1207,20 @@ class MainWindow:
             if not booking_info:
                 return
 
-            status = booking_info['status']
-            booking_index = booking_info['index']
+            status = booking_info.status
+            booking_index = booking_info.index
 
             # Only allow processing if status is pending or error
             if status == 'processing':
-                messagebox.showinfo(
+                self._show_info(
                     "Already Processing",
                     "This booking is currently being processed."
                 )
                 return
             elif status == 'done':
                 # Ask if user wants to reprocess
-                result = messagebox.askyesno(
+                result = self._ask(
+                    "askyesno",
                     "Reprocess Booking",
                     "This booking has already been completed.\n\n"
                     "Do you want to process it again?"
@@ -957,7 +1233,7 @@ class MainWindow:
             self._process_single_booking(booking_index, item_id)
 
         except Exception as e:
-            logger.error(f"Error handling tree click: {str(e)}")
+            logger.error("Error handling tree click: %s", e)
 
     def _process_single_booking(self, booking_index: int, item_id: str):
         """Process a single booking when user clicks the action button.
@@ -971,7 +1247,7 @@ class MainWindow:
 
             # Set processing flag
             self.is_processing = True
-            self.stop_processing = False
+            self._cancel_event.clear()
 
             # Disable all action buttons during processing
             self._disable_all_action_buttons()
@@ -982,47 +1258,44 @@ class MainWindow:
             self.clear_file_button.config(state="disabled")
 
             # Get the booking data
-            booking = self.booking_statuses[item_id]['booking']
+            booking = self.booking_statuses[item_id].booking
 
             # Update status to processing
             self._update_booking_status(booking_index, 'processing')
-            self.root.update()
 
             # Update status message
             self._update_status(f"Processing booking {booking_index + 1}...")
 
-            # Schedule the actual booking creation on main thread
-            self.root.after(100, lambda: self._execute_single_booking_from_action(booking_index, booking, item_id))
+            # Create the booking on the automation thread
+            self._submit_automation(self._run_single_booking, booking_index, booking)
 
         except Exception as e:
-            logger.error(f"Error starting single booking processing: {str(e)}")
+            logger.error("Error starting single booking processing: %s", e)
             self.is_processing = False
             self._enable_all_action_buttons()
             self.create_bookings_button.config(state="normal")
             self.stop_button.config(state="disabled")
             self.clear_file_button.config(state="normal")
-            messagebox.showerror("Error", f"Failed to process booking:\n\n{str(e)}")
+            self._show_error("Error", f"Failed to process booking:\n\n{str(e)}")
 
-    def _execute_single_booking_from_action(self, booking_index: int, booking: Dict[str, Any], item_id: str):
-        """Execute the booking creation for a single booking clicked by user."""
+    def _run_single_booking(self, booking_index: int, booking: Dict[str, Any]):
+        """Create a single booking clicked by user (runs on the automation thread)."""
+        error = None
         try:
-            # Set up a callback for the web automation to call periodically
-            def ui_update_callback():
-                """Called periodically during booking creation to keep UI responsive."""
-                self.root.update_idletasks()
-                self.root.update()
-                return self.stop_processing  # Return True if stop was requested
-
-            # Pass the callback to web automation
-            self.web_automation.set_ui_callback(ui_update_callback)
-
-            # Create the booking
+            self.web_automation.set_ui_callback(self._cancel_event.is_set)
             success = self.web_automation.create_single_booking(booking)
+        except Exception as e:
+            success = False
+            error = str(e)
+        finally:
+            if self.web_automation:
+                self.web_automation.set_ui_callback(None)
 
-            # Clear the callback
-            self.web_automation.set_ui_callback(None)
+        self.root.after(0, self._on_single_booking_done, booking_index, success, error)
 
-            # Update status based on result
+    def _on_single_booking_done(self, booking_index: int, success: bool, error: Optional[str]):
+        """Show the result of a single booking and re-enable the controls."""
+        if error is None:
             if success:
                 self._update_booking_status(booking_index, 'done')
                 self._update_status(f"Booking {booking_index + 1} completed successfully!")
@@ -1030,60 +1303,43 @@ class MainWindow:
             else:
                 self._update_booking_status(booking_index, 'error')
                 self._update_status(f"Booking {booking_index + 1} failed!")
-                logger.error(f"Booking {booking_index + 1} failed")
-
-            # Force UI update
-            self.root.update()
-
-            # Re-enable buttons
-            self.is_processing = False
-            self._enable_all_action_buttons()
-            self.create_bookings_button.config(state="normal")
-            self.stop_button.config(state="disabled")
-            self.clear_file_button.config(state="normal")
+                logger.error("Booking %s failed", booking_index + 1)
+        elif "stopped by user" in error.lower():
+            logger.info(f"Booking {booking_index + 1} processing stopped by user")
+            self._update_status(f"Processing stopped by user")
+        else:
+            logger.error("Error executing single booking: %s", error)
+            self._update_booking_status(booking_index, 'error')
+            self._update_status(f"Error processing booking {booking_index + 1}")
+
+        # Re-enable buttons
+        self.is_processing = False
+        self._cancel_event.clear()
+        self._enable_all_action_buttons()
+        self.create_bookings_button.config(state="normal")
+        self.stop_button.config(state="disabled")
+        self.clear_file_button.config(state="normal")
 
-            # Update progress bar based on completed bookings
-            self._update_progress_from_statuses()
+        # Update progress bar based on completed bookings
+        self._update_progress_from_statuses()
 
-        except Exception as e:
-            if "stopped by user" in str(e).lower():
-                logger.info(f"Booking {booking_index + 1} processing stopped by user")
-                self._update_status(f"Processing stopped by user")
-            else:
-                logger.error(f"Error executing single booking: {str(e)}")
-                self._update_booking_status(booking_index, 'error')
-                self._update_status(f"Error processing booking {booking_index + 1}")
-
-            # Re-enable buttons
-            self.is_processing = False
-            self._enable_all_action_buttons()
-            self.create_bookings_button.config(state="normal")
-            self.stop_button.config(state="disabled")
-            self.clear_file_button.config(state="normal")
+        # Save the booking status to the Excel file
+        self._flush_excel_status()
 
     def _disable_all_action_buttons(self):
         """Disable all action buttons in the table during processing."""
-        for item_id in self.bookings_tree.get_children():
-            values = list(self.bookings_tree.item(item_id, 'values'))
+        for idx, values in enumerate(self.row_cache):
             values[-1] = "⏸ Disabled"
-            self.bookings_tree.item(item_id, values=values)
+            self._refresh_row(idx)
 
     def _enable_all_action_buttons(self):
         """Re-enable all action buttons in the table after processing."""
         for item_id, info in self.booking_statuses.items():
-            status = info['status']
-            values = list(self.bookings_tree.item(item_id, 'values'))
-
-            if status == 'done':
-                values[-1] = "✓ Done"
-            elif status == 'error':
-                values[-1] = "⟳ Retry"
-            elif status == 'processing':
-                values[-1] = "⏸ Processing..."
-            else:  # pending
-                values[-1] = "▶ Process"
+            status = info.status
+            values = self.row_cache[info.index]
+            values[-1] = self.ACTION_TEXT.get(status, self.ACTION_TEXT['pending'])
 
-            self.bookings_tree.item(item_id, values=values)
+            self._refresh_row(info.index)
 
     def _update_progress_from_statuses(self):
         """Update progress bar based on current booking statuses."""
@@ -1091,7 +1347,7 @@ class MainWindow:
             return
 
         total = len(self.booking_statuses)
-        completed = sum(1 for info in self.booking_statuses.values() if info['status'] == 'done')
+        completed = self.status_counts['done']
 
         progress = (completed / total) * 100 if total > 0 else 0
         self._update_progress(progress)
@@ -1101,14 +1357,28 @@ class MainWindow:
         try:
             self.root.mainloop()
         except Exception as e:
-            logger.error(f"Error in GUI main loop: {str(e)}")
+            logger.error("Error in GUI main loop: %s", e)
             raise
+        finally:
+            self._shutdown_automation()
+
+            # Don't lose status updates still queued or held in memory
+            self._shutdown_excel()
+
+    def _shutdown_automation(self):
+        """Stop any running bookings and let the automation thread exit."""
+        self._cancel_event.set()
+        if self._automation_executor:
+            self._automation_executor.shutdown(wait=False)
+            self._automation_executor = None
     
     def destroy(self):
         """Clean up and destroy the window."""
         try:
+            self._shutdown_automation()
+            self._shutdown_excel()
             if self.root:
                 self.root.destroy()
                 logger.info("Main window destroyed")
         except Exception as e:
-            logger.error(f"Error destroying main window: {str(e)}")
+            logger.error("Error destroying main window: %s", e)
@@ -2,8 +2,10 @@
 Logging configuration for TNS Booking Uploader Bot.
 """
 
+import atexit
 import logging
 import logging.handlers
+import queue
 from datetime import datetime
 from pathlib import Path
 
@@ -26,6 +28,9 @@ def _setup_logger():
     _logger = logging.getLogger("TNSBookingUploader")
     _logger.setLevel(logging.DEBUG)
 
+    # Our own handlers write every record; don't format it again for the root logger
+    _logger.propagate = False
+
     # Prevent duplicate handlers
     if _logger.handlers:
         return _logger
@@ -49,9 +54,17 @@ def _setup_logger():
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(console_formatter)
 
-    # Add handlers to logger
-    _logger.addHandler(file_handler)
-    _logger.addHandler(console_handler)
+    # Log calls only put the record on a queue; a background listener thread
+    # does the file and console writes so callers (e.g. the UI thread) never wait on I/O
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Write out anything still queued when the program exits
+    atexit.register(listener.stop)
+
+    _logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return _logger
 
@@ -4,6 +4,7 @@ Data validation utilities for TNS Booking Uploader Bot.
 
 import os
 import re
+from stat import S_ISREG
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, Optional
@@ -12,6 +13,15 @@ from .logger import get_logger
 
 logger = get_logger()
 
+# Accepts exactly the strings that Validator.TIME_FORMATS parse via strptime
+# (hour 0-23 or 1-12 with AM/PM, minute and second 0-59), compiled once at
+# import instead of trying every format on every call
+_TIME_RE = re.compile(
+    r'(?:2[0-3]|[01]?\d):[0-5]?\d(?::[0-5]?\d)?'
+    r'|(?:1[0-2]|0?[1-9]):[0-5]?\d(?::[0-5]?\d)?\s+[ap]m',
+    re.IGNORECASE
+)
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
@@ -27,25 +37,28 @@ class Validator:
     DATE_FORMATS = ['%m/%d/%Y', '%d/%m/%Y', '%Y-%m-%d', '%m-%d-%Y', '%d-%m-%Y']
     TIME_FORMATS = ['%H:%M', '%I:%M %p', '%H:%M:%S', '%I:%M:%S %p']
 
+    @staticmethod
+    def has_excel_extension(file_path: str) -> bool:
+        """Check only the file name for a supported Excel extension (no disk access)."""
+        return Path(file_path).suffix.lower() in Validator.SUPPORTED_EXCEL_EXTENSIONS
+
     @staticmethod
     def is_valid_excel_file(file_path: str) -> bool:
         """Check if the file is a valid Excel file."""
         try:
-            path = Path(file_path)
-
-            if not path.exists() or not path.is_file():
-                return False
-
-            if path.suffix.lower() not in Validator.SUPPORTED_EXCEL_EXTENSIONS:
+            if not Validator.has_excel_extension(file_path):
                 return False
 
-            if path.stat().st_size == 0:
+            # One stat call answers exists, is-a-file and non-empty
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
                 return False
 
-            return True
+            return S_ISREG(file_stat.st_mode) and file_stat.st_size > 0
 
         except Exception as e:
-            logger.error(f"Error validating file: {str(e)}")
+            logger.error("Error validating file: %s", e)
             return False
 
     @staticmethod
@@ -56,9 +69,12 @@ class Validator:
             columns_clean = []
             for col in columns:
                 if col is not None:
-                    # Remove any non-printable characters and normalize whitespace
-                    clean_col = ''.join(char for char in str(col) if char.isprintable()).strip()
-                    columns_clean.append(clean_col)
+                    # Remove any non-printable characters and normalize whitespace;
+                    # most headers are fully printable, which one C-level check confirms
+                    col = str(col)
+                    if not col.isprintable():
+                        col = ''.join(char for char in col if char.isprintable())
+                    columns_clean.append(col.strip())
 
             columns_lower = [col.lower() for col in columns_clean if col]
             required_lower = [col.lower() for col in Validator.REQUIRED_COLUMNS]
@@ -66,19 +82,19 @@ class Validator:
             missing_columns = [col for col in required_lower if col not in columns_lower]
 
             if missing_columns:
-                logger.error(f"Column validation failed. Missing: {missing_columns}")
+                logger.error("Column validation failed. Missing: %s", missing_columns)
                 return False
 
             return True
 
         except Exception as e:
-            logger.error(f"Error validating column structure: {str(e)}")
+            logger.error("Error validating column structure: %s", e)
             return False
     
     @staticmethod
     def validate_date_format(date_value) -> bool:
         """Validate date format - handles both strings and datetime objects."""
-        if date_value is None or str(date_value).strip() == '' or str(date_value).lower() == 'nan':
+        if date_value is None or str(date_value).strip() == '' or str(date_value).lower() in ('nan', 'nat'):
             return False
 
         # If it's already a datetime object (from Excel), it's valid
@@ -99,38 +115,28 @@ class Validator:
     @staticmethod
     def validate_time_format(time_value) -> bool:
         """Validate time format - handles both strings and time objects."""
-        if time_value is None or str(time_value).strip() == '' or str(time_value).lower() == 'nan':
+        if time_value is None or str(time_value).strip() == '' or str(time_value).lower() in ('nan', 'nat'):
             return False
 
         # If it's already a time object (from Excel), it's valid
         if hasattr(time_value, 'hour') and hasattr(time_value, 'minute'):
             return True
 
-        # If it's a string, try to parse it and validate the time
-        time_str = str(time_value).strip()
-
-        # Check for invalid times like 24:57, 25:21, etc.
-        if ':' in time_str:
-            try:
-                parts = time_str.split(':')
-                if len(parts) >= 2:
-                    hour = int(parts[0])
-                    minute = int(parts[1])
-                    # Valid time ranges: hour 0-23, minute 0-59
-                    if hour > 23 or minute > 59:
-                        return False
-            except ValueError:
-                pass  # Will be caught by format validation below
-
-        for time_format in Validator.TIME_FORMATS:
-            try:
-                datetime.strptime(time_str, time_format)
-                return True
-            except ValueError:
-                continue
-
-        return False
+        # If it's a string, match it against the accepted time formats
+        return _TIME_RE.fullmatch(str(time_value).strip()) is not None
     
+    @staticmethod
+    def _cell_text(value) -> str:
+        """Return a cell's stripped text, or '' for empty cells (None, NaN, NaT)."""
+        if value is None:
+            return ''
+        try:
+            if value != value:  # NaN and NaT are not equal to themselves
+                return ''
+        except TypeError:  # pandas.NA can't be used as a bool
+            return ''
+        return str(value).strip()
+
     @staticmethod
     def validate_row_data(row_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -154,22 +160,22 @@ class Validator:
                 errors.append("Invalid or missing time")
             
             # Validate driver (should not be empty)
-            driver = str(row_data.get('Driver', '')).strip()
+            driver = Validator._cell_text(row_data.get('Driver', ''))
             if not driver or driver.lower() == 'nan':
                 errors.append("Driver name is required")
             
             # Validate From location (should not be empty)
-            from_location = str(row_data.get('From', '')).strip()
+            from_location = Validator._cell_text(row_data.get('From', ''))
             if not from_location or from_location.lower() == 'nan':
                 errors.append("From location is required")
             
             # Validate To location (should not be empty)
-            to_location = str(row_data.get('To', '')).strip()
+            to_location = Validator._cell_text(row_data.get('To', ''))
             if not to_location or to_location.lower() == 'nan':
                 errors.append("To location is required")
             
             # Validate Shift (should be numeric)
-            shift = str(row_data.get('Shift', '')).strip()
+            shift = Validator._cell_text(row_data.get('Shift', ''))
             if shift and shift.lower() != 'nan':
                 try:
                     int(shift)
@@ -182,5 +188,5 @@ class Validator:
             return is_valid, errors
             
         except Exception as e:
-            logger.error(f"Error validating row data: {str(e)}")
+            logger.error("Error validating row data: %s", e)
             return False, [f"Validation error: {str(e)}"]
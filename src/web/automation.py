@@ -185,6 +185,12 @@ class WebAutomation:
                 logger.error("Playwright not installed. Please install with: pip install playwright")
                 return False
 
+            # Start over if the user closed the browser since it was opened; the
+            # persistent profile in user_data_dir keeps the login for the new session
+            if self.playwright and not self._is_session_open():
+                logger.info("Browser was closed, launching a new session")
+                self.close_browser()
+
             # Initialize Playwright if not already done
             if not self.playwright:
                 self.playwright = sync_playwright().start()
@@ -1110,29 +1116,79 @@ class WebAutomation:
             logger.error(f"Error filling date/time: {e}")
             raise
 
-    def close_browser(self):
-        """Close the browser and cleanup resources."""
+    def _is_session_open(self) -> bool:
+        """Check whether the browser page opened earlier is still usable."""
         try:
-            # Save browser state before closing (for non-persistent context)
-            if self.browser:
-                self._save_browser_state()
+            if self.page is None or self.page.is_closed():
+                return False
+            return self.browser is None or self.browser.is_connected()
+        except Exception:
+            return False
 
-            # Close browser or context
-            if self.context:
-                self.context.close()
-            if self.browser:
-                self.browser.close()
-            if self.playwright:
-                self.playwright.stop()
-
-            # Reset all browser-related attributes
-            self.playwright = None
-            self.browser = None
-            self.context = None
-            self.page = None
+    def close_browser(self):
+        """Close the browser and cleanup resources.
+
+        Each resource is released separately, so a failure closing the context
+        or browser still stops Playwright's driver. An attribute is only reset
+        once its resource is released; a failed close is retried next time.
+        """
+        # Save browser state before closing (for non-persistent context)
+        if self.browser:
+            self._save_browser_state()
+
+        # The page goes away with its context
+        self.page = None
+
+        # Close context, then browser, then stop the Playwright driver
+        for name, release in (('context', 'close'), ('browser', 'close'), ('playwright', 'stop')):
+            resource = getattr(self, name)
+            if resource is None:
+                continue
+            try:
+                getattr(resource, release)()
+                setattr(self, name, None)
+            except Exception as e:
+                logger.error(f"Error closing {name}: {e}")
+
+        if self.context or self.browser or self.playwright:
+            logger.warning("Some browser resources could not be released")
+        else:
             logger.info("Browser closed and resources cleaned up (session saved)")
-        except Exception as e:
-            logger.error(f"Error closing browser: {e}")
+
+    @classmethod
+    def clear_state_files(cls, browser_state_path: Optional[Path] = None, user_data_dir: Optional[Path] = None):
+        """Delete the saved browser state file and user data directory.
+
+        Works without a browser session, so state can be cleared without
+        creating a WebAutomation instance.
+
+        Args:
+            browser_state_path: State file to delete (defaults to BROWSER_STATE_FILE)
+            user_data_dir: User data directory to delete (defaults to USER_DATA_DIR)
+        """
+        browser_state_path = Path(browser_state_path or cls.BROWSER_STATE_FILE)
+        user_data_dir = Path(user_data_dir or cls.USER_DATA_DIR)
+
+        # Delete browser state file (saved credentials)
+        logger.info("Deleting browser state file...")
+        if browser_state_path.exists():
+            browser_state_path.unlink()
+            logger.info(f"  ✅ Deleted: {browser_state_path}")
+        else:
+            logger.info(f"  ℹ️  File doesn't exist: {browser_state_path}")
+
+        # Delete user data directory (cookies, cache, sessions)
+        logger.info("Deleting user data directory...")
+        if user_data_dir.exists():
+            import shutil
+            shutil.rmtree(user_data_dir)
+            logger.info(f"  ✅ Deleted directory: {user_data_dir}")
+
+            # Recreate empty directory for next use
+            user_data_dir.mkdir(exist_ok=True)
+            logger.info(f"  ✅ Recreated empty directory: {user_data_dir}")
+        else:
+            logger.info(f"  ℹ️  Directory doesn't exist: {user_data_dir}")
 
     def clear_browser_state(self):
         """Clear saved browser authentication state, cookies, sessions, and cache.
@@ -1151,47 +1207,16 @@ class WebAutomation:
             # Step 1: Close any active browser sessions
             if self.context or self.browser or self.playwright:
                 logger.info("Step 1: Closing active browser sessions...")
-                try:
-                    if self.context:
-                        logger.info("  - Closing browser context...")
-                        self.context.close()
-                        self.context = None
-                    if self.browser:
-                        logger.info("  - Closing browser...")
-                        self.browser.close()
-                        self.browser = None
-                    if self.playwright:
-                        logger.info("  - Stopping Playwright...")
-                        self.playwright.stop()
-                        self.playwright = None
-                    if self.page:
-                        self.page = None
+                self.close_browser()
+                if self.context or self.browser or self.playwright:
+                    logger.warning("  ⚠️  Error closing browser")
+                else:
                     logger.info("  ✅ Active browser sessions closed")
-                except Exception as e:
-                    logger.warning(f"  ⚠️  Error closing browser: {e}")
             else:
                 logger.info("Step 1: No active browser sessions to close")
 
-            # Step 2: Delete browser state file (saved credentials)
-            logger.info("Step 2: Deleting browser state file...")
-            if self.browser_state_path.exists():
-                self.browser_state_path.unlink()
-                logger.info(f"  ✅ Deleted: {self.browser_state_path}")
-            else:
-                logger.info(f"  ℹ️  File doesn't exist: {self.browser_state_path}")
-
-            # Step 3: Delete user data directory (cookies, cache, sessions)
-            logger.info("Step 3: Deleting user data directory...")
-            if self.user_data_dir.exists():
-                import shutil
-                shutil.rmtree(self.user_data_dir)
-                logger.info(f"  ✅ Deleted directory: {self.user_data_dir}")
-
-                # Recreate empty directory for next use
-                self.user_data_dir.mkdir(exist_ok=True)
-                logger.info(f"  ✅ Recreated empty directory: {self.user_data_dir}")
-            else:
-                logger.info(f"  ℹ️  Directory doesn't exist: {self.user_data_dir}")
+            # Steps 2-3: Delete the saved state file and user data directory
+            self.clear_state_files(self.browser_state_path, self.user_data_dir)
 
             logger.info("")
             logger.info("✅ BROWSER STATE CLEARED SUCCESSFULLY!")
@@ -8,6 +8,7 @@ import tempfile
 import os
 from pathlib import Path
 import sys
+from unittest.mock import patch
 
 # Add src to path for testing
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -48,6 +49,12 @@ class TestValidator:
         """Test validation of non-existent file."""
         assert Validator.is_valid_excel_file("nonexistent_file.xlsx") == False
     
+    def test_has_excel_extension(self):
+        """Test the extension-only check does not need the file to exist."""
+        assert Validator.has_excel_extension("missing/Bookings.XLSX") == True
+        assert Validator.has_excel_extension("bookings.xls") == True
+        assert Validator.has_excel_extension("bookings.csv") == False
+
     def test_empty_file(self):
         """Test validation of empty file."""
         with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp:
@@ -88,7 +95,7 @@ class TestValidator:
 
     def test_invalid_date_formats(self):
         """Test validation of invalid date formats."""
-        invalid_dates = ['', 'nan', 'invalid_date', '32/13/2025', None]
+        invalid_dates = ['', 'nan', 'invalid_date', '32/13/2025', None, pd.NaT]
 
         for date_str in invalid_dates:
             assert Validator.validate_date_format(date_str) == False
@@ -167,13 +174,15 @@ class TestExcelProcessor:
         
         try:
             processor = ExcelProcessor()
-            result = processor.process_file(tmp_path)
+            progress = []
+            result = processor.process_file(tmp_path, progress_callback=progress.append)
             
             assert result.success == True
             assert result.row_count == 2
             assert result.valid_rows == 2
             assert result.invalid_rows == 0
             assert len(result.data) == 2
+            assert progress == sorted(progress) and progress[0] == 0.0 and progress[-1] == 1.0
             
         finally:
             os.unlink(tmp_path)
@@ -208,6 +217,89 @@ class TestExcelProcessor:
         finally:
             os.unlink(tmp_path)
     
+    def test_invalid_row_errors_match_validator(self):
+        """Test that batch validation reports the same errors as validate_row_data."""
+        test_data = {
+            'Date': ['invalid_date', '4/9/2025', '4/9/2025'],
+            'Time': ['25:00', '02:41', '02:41'],
+            'Driver': ['', 'JAMES Quin', 'JAMES Quin'],
+            'From': ['NME', '', 'FKND'],
+            'To': ['CPS03O', 'KANS09', 'KANS09'],
+            'Reason': ['', '', ''],
+            'Shift': ['1001', 'abc', '211']
+        }
+
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp:
+            self.create_test_excel_file(test_data, tmp.name)
+            tmp_path = tmp.name
+
+        try:
+            processor = ExcelProcessor()
+            result = processor.process_file(tmp_path)
+
+            assert result.success == True
+            assert result.valid_rows == 1
+            assert result.invalid_rows == 2
+
+            for row in result.data:
+                is_valid, errors = Validator.validate_row_data(row)
+                assert row['is_valid'] == is_valid
+                assert row['errors'] == errors
+
+            assert "Row 2: Invalid or missing date" in result.errors
+            assert "Row 3: Shift must be a number" in result.errors
+
+        finally:
+            os.unlink(tmp_path)
+
+    def test_empty_cells_match_validator(self):
+        """Test that None/NaT cells count as missing in both batch and row validation."""
+        df = pd.DataFrame({
+            'Date': ['4/9/2025', '4/9/2025', '4/9/2025'],
+            'Time': ['02:41', '02:41', '02:41'],
+            'Driver': [None, pd.NaT, 'JAMES Quin'],
+            'From': ['FKND', 'FKND', None],
+            'To': ['KANS09', 'KANS09', 'KANS09'],
+            'Reason': ['', '', ''],
+            'Shift': [None, pd.NaT, '211']
+        }, dtype=object)
+
+        valid_mask, error_matrix = ExcelProcessor()._vectorized_validate(df)
+
+        for position, row in enumerate(df.to_dict('records')):
+            is_valid, errors = Validator.validate_row_data(row)
+            assert bool(valid_mask.iloc[position]) == is_valid == False
+            assert [name for name, failed in error_matrix.iloc[position].items() if failed] == errors
+
+    def test_iter_process_matches_process_file(self):
+        """Test that streamed rows validate the same way as process_file."""
+        test_data = {
+            'Date': ['invalid_date', '4/9/2025', '4/9/2025'],
+            'Time': ['02:09', '02:41', '25:00'],
+            'Driver': ['MAJCEN Dennis', 'JAMES Quin', ''],
+            'From': ['NME', 'FKND', 'FKND'],
+            'To': ['CPS03O', 'KANS09', 'KANS09'],
+            'Reason': ['', '', ''],
+            'Shift': ['1001', '211', '211']
+        }
+
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp:
+            self.create_test_excel_file(test_data, tmp.name)
+            tmp_path = tmp.name
+
+        try:
+            processor = ExcelProcessor()
+            streamed = list(processor.iter_process(tmp_path))
+            result = ExcelProcessor().process_file(tmp_path)
+
+            assert [row['row_number'] for row in streamed] == [row['row_number'] for row in result.data]
+            assert [row['is_valid'] for row in streamed] == [row['is_valid'] for row in result.data]
+            assert processor.last_stats['valid_count'] == result.valid_rows
+            assert processor.last_stats['errors'] == result.errors
+
+        finally:
+            os.unlink(tmp_path)
+
     def test_process_file_with_wrong_columns(self):
         """Test processing of Excel file with wrong column structure."""
         # Create test data with wrong columns
@@ -276,6 +368,132 @@ class TestExcelProcessor:
         finally:
             os.unlink(tmp_path)
     
+    def test_update_booking_status_is_written_on_flush(self):
+        """Test that status updates are held in memory until flushed."""
+        test_data = {
+            'Date': ['4/9/2025', '4/9/2025'],
+            'Time': ['02:09', '02:41'],
+            'Driver': ['MAJCEN Dennis', 'JAMES Quin'],
+            'From': ['NME', 'FKND'],
+            'To': ['CPS03O', 'KANS09'],
+            'Reason': ['', ''],
+            'Shift': ['1001', '211']
+        }
+
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp:
+            self.create_test_excel_file(test_data, tmp.name)
+            tmp_path = tmp.name
+
+        try:
+            processor = ExcelProcessor()
+            assert processor.process_file(tmp_path).success == True
+
+            assert processor.update_booking_status(tmp_path, 3, 'Done') == True
+            assert pd.read_excel(tmp_path)['Status'].isna().all()
+
+            assert processor.flush() == True
+            statuses = pd.read_excel(tmp_path)['Status'].tolist()
+            assert statuses[1] == 'Done'
+
+            # Out-of-range rows are rejected
+            assert processor.update_booking_status(tmp_path, 10, 'Done') == False
+
+            # Updates made after a flush are written by close()
+            assert processor.update_booking_status(tmp_path, 2, 'Error') == True
+            assert processor.close() == True
+            assert pd.read_excel(tmp_path)['Status'].tolist() == ['Error', 'Done']
+
+        finally:
+            os.unlink(tmp_path)
+
+    def test_process_file_reuses_disk_cache(self):
+        """Test a result cached on disk is reused by a new processor until the file changes."""
+        test_data = {
+            'Date': ['4/9/2025', 'invalid_date'],
+            'Time': ['02:09', '02:41'],
+            'Driver': ['MAJCEN Dennis', 'JAMES Quin'],
+            'From': ['NME', 'FKND'],
+            'To': ['CPS03O', 'KANS09'],
+            'Reason': ['', ''],
+            'Shift': ['1001', '211']
+        }
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            tmp_path = os.path.join(cache_dir, 'bookings.xlsx')
+            self.create_test_excel_file(test_data, tmp_path)
+
+            first = ExcelProcessor(cache_dir=cache_dir).process_file(tmp_path)
+
+            # A fresh processor (e.g. after a restart) must not read the workbook again
+            processor = ExcelProcessor(cache_dir=cache_dir)
+            with patch.object(processor, '_read_excel_file', side_effect=AssertionError("file was re-read")):
+                cached = processor.process_file(tmp_path)
+            assert cached.row_count == first.row_count
+            assert cached.errors == first.errors
+            assert [row['Driver'] for row in cached.data] == ['MAJCEN Dennis', 'JAMES Quin']
+
+            # Changing the file invalidates the cached result
+            self.create_test_excel_file({**test_data, 'Date': ['4/9/2025', '4/9/2025']}, tmp_path)
+            result = ExcelProcessor(cache_dir=cache_dir).process_file(tmp_path)
+            assert result.valid_rows == 2
+
+    def test_disk_cache_ignores_other_cache_versions(self):
+        """Test results saved under another CACHE_VERSION are discarded, not reused."""
+        test_data = {
+            'Date': ['4/9/2025'],
+            'Time': ['02:09'],
+            'Driver': ['MAJCEN Dennis'],
+            'From': ['NME'],
+            'To': ['CPS03O'],
+            'Reason': [''],
+            'Shift': ['1001']
+        }
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            tmp_path = os.path.join(cache_dir, 'bookings.xlsx')
+            self.create_test_excel_file(test_data, tmp_path)
+
+            with patch.object(ExcelProcessor, 'CACHE_VERSION', ExcelProcessor.CACHE_VERSION - 1):
+                ExcelProcessor(cache_dir=cache_dir).process_file(tmp_path)
+            old_files = list(Path(cache_dir).glob('*.pkl'))
+            assert len(old_files) == 1
+
+            # The current version doesn't read the old result and removes it on save
+            processor = ExcelProcessor(cache_dir=cache_dir)
+            with patch.object(processor, '_read_excel_file', wraps=processor._read_excel_file) as read:
+                result = processor.process_file(tmp_path)
+            assert read.called
+            assert result.valid_rows == 1
+            assert not old_files[0].exists()
+            assert len(list(Path(cache_dir).glob('*.pkl'))) == 1
+
+    def test_export_validation_report(self):
+        """Test exporting the validation report."""
+        processed_data = [
+            {'row_number': 2, 'Date': '4/9/2025', 'Time': '02:09', 'Driver': 'MAJCEN Dennis',
+             'From': 'NME', 'To': 'CPS03O', 'Reason': '', 'Shift': '1001',
+             'is_valid': True, 'errors': []},
+            {'row_number': 3, 'Date': 'invalid_date', 'Time': '02:41', 'Driver': float('nan'),
+             'From': 'FKND', 'To': 'KANS09', 'Reason': '', 'Shift': '211',
+             'is_valid': False, 'errors': ['Invalid or missing date', 'Driver name is required']}
+        ]
+
+        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp:
+            tmp_path = tmp.name
+
+        try:
+            processor = ExcelProcessor()
+            assert processor.export_validation_report(processed_data, tmp_path) == True
+
+            report = pd.read_excel(tmp_path)
+            assert list(report.columns) == list(ExcelProcessor.REPORT_COLUMNS)
+            assert report['Row Number'].tolist() == [2, 3]
+            assert report['Valid'].tolist() == ['Yes', 'No']
+            assert report['Errors'][1] == 'Invalid or missing date; Driver name is required'
+
+        finally:
+            os.unlink(tmp_path)
+
     def test_get_sample_data_format(self):
         """Test getting sample data format."""
         processor = ExcelProcessor()
@@ -5,7 +5,7 @@ Tests for web automation functionality.
 import pytest
 import sys
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 # Add src to path for testing
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -73,6 +73,23 @@ class TestWebAutomation:
         # Test clearing when file doesn't exist (should not error)
         automation.clear_browser_state()
 
+    def test_close_browser_stops_playwright_when_close_fails(self):
+        """Test a failed context close still stops Playwright and keeps the context for retry."""
+        automation = WebAutomation()
+        context = MagicMock()
+        context.close.side_effect = Exception("Target closed")
+        playwright = MagicMock()
+        automation.context = context
+        automation.playwright = playwright
+        automation.page = MagicMock()
+
+        automation.close_browser()
+
+        playwright.stop.assert_called_once()
+        assert automation.playwright is None
+        assert automation.context is context
+        assert automation.page is None
+
     def test_start_booking_creation_no_data(self):
         """Test booking creation with no valid data."""
         automation = WebAutomation()